@@ -15,11 +15,11 @@ import numpy as np
 from PyQt5.QtWidgets import *
 from PyQt5.QtGui import *
 from PyQt5.QtCore import *
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import csv  # 新增：用于CSV导出功能
 import os   # 新增：用于批量处理功能
+import math  # 新增：报告派生指标计算
+import hashlib  # 新增：用于结果哈希缓存，跳过重复图表重绘
+from collections import OrderedDict  # 新增：分析结果的小容量LRU缓存
+from concurrent.futures import ProcessPoolExecutor, as_completed  # 新增：批量处理并行化
 
 # 导入自定义模块
 from image_analyzer import perform_contour_analysis, create_contour_result_image
@@ -30,6 +30,96 @@ from utilities import (
 )
 
 
+# matplotlib按需导入：冷启动不再支付300-600ms的导入成本，
+# 首次构建图表画布时才加载并应用全局字体配置
+plt = None
+Figure = None
+FigureCanvas = None
+
+
+def _ensure_matplotlib():
+    """首次使用时导入matplotlib并配置全局字体"""
+    global plt, Figure, FigureCanvas
+    if plt is not None:
+        return
+    import matplotlib.pyplot as _plt
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as _FigureCanvas
+    from matplotlib.figure import Figure as _Figure
+    plt, Figure, FigureCanvas = _plt, _Figure, _FigureCanvas
+
+    # 设置matplotlib字体
+    plt.rcParams['font.family'] = ['Segoe UI', 'DejaVu Sans', 'sans-serif']
+    plt.rcParams['axes.unicode_minus'] = False
+
+
+# 图表文字的字体配置常量：模块级共享，重绘路径上不再反复构造fontdict字典
+_FONT_AX = {'family': 'DejaVu Sans', 'size': 11}
+_FONT_TITLE = {'family': 'DejaVu Sans', 'size': 12, 'weight': 'bold'}
+_FONT_SM = {'family': 'DejaVu Sans', 'size': 9}
+_FONT_SM_TITLE = {'family': 'DejaVu Sans', 'size': 10, 'weight': 'bold'}
+_FONT_CBAR = {'family': 'DejaVu Sans', 'size': 10}
+_FONT_PIE_TITLE = {'family': 'DejaVu Sans', 'size': 13, 'weight': 'bold'}
+_FONT_HIST_AX = {'family': 'Segoe UI', 'size': 13}
+_FONT_HIST_TITLE = {'family': 'Segoe UI', 'size': 14, 'weight': 'bold'}
+
+
+def _box_stats(values, label):
+    """预计算箱线图统计量，供Axes.bxp直接绘制
+
+    一次np.quantile调用取三个分位数，须线按1.5×IQR截断到数据范围内，
+    范围外的点作为离群值返回
+    """
+    q1, med, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    lo_limit = q1 - 1.5 * iqr
+    hi_limit = q3 + 1.5 * iqr
+    inliers = values[(values >= lo_limit) & (values <= hi_limit)]
+    fliers = values[(values < lo_limit) | (values > hi_limit)]
+    return {
+        'label': label,
+        'mean': float(values.mean()),
+        'med': float(med),
+        'q1': float(q1),
+        'q3': float(q3),
+        'whislo': float(inliers.min()) if len(inliers) else float(q1),
+        'whishi': float(inliers.max()) if len(inliers) else float(q3),
+        'fliers': fliers,
+    }
+
+
+# 批量处理结果的结构化数组布局（SoA），汇总统计可直接按列做C级归约
+BATCH_RESULT_DTYPE = np.dtype([
+    ('filename', 'U260'), ('contour_count', 'i4'), ('largest_area', 'f8'),
+    ('largest_perimeter', 'f8'), ('total_area', 'f8'), ('area_ratio', 'f4')
+])
+
+
+# 新增：批量处理的工作函数（模块级定义，便于进程池序列化）
+def _batch_analyze_file(file_path, analysis_params):
+    """在独立进程中读取并分析单张图像，返回汇总结果字典"""
+    image = cv2.imread(file_path)
+    if image is None:
+        return None
+
+    # 批量汇总只需top-k与总量统计，跳过完整排序的明细生成
+    contour_results = perform_contour_analysis(
+        image,
+        canny_t1=analysis_params['canny_t1'],
+        canny_t2=analysis_params['canny_t2'],
+        min_area=analysis_params['min_area'],
+        detailed=False
+    )
+
+    return {
+        'filename': os.path.basename(file_path),
+        'contour_count': contour_results['contour_count'],
+        'largest_area': contour_results['largest_area'],
+        'largest_perimeter': contour_results['largest_perimeter'],
+        'total_area': contour_results['total_area'],
+        'area_ratio': contour_results['area_ratio']
+    }
+
+
 # 新增：参数设置对话框类
 class SettingsDialog(QDialog):
     """
@@ -145,6 +235,12 @@ class StoneAnalysisDemo(QMainWindow):
     
     def __init__(self):
         super().__init__()
+
+        # 确保OpenCV启用SIMD优化路径；内部线程数限制为核心数的一半，
+        # 避免与我们自己的分析线程池在8核以上机器上过度订阅
+        cv2.setUseOptimized(True)
+        cv2.setNumThreads(max(1, os.cpu_count() // 2))
+
         self.current_image = None
         
         # 新增：分析参数存储
@@ -159,7 +255,27 @@ class StoneAnalysisDemo(QMainWindow):
         
         # 新增：详细结果存储（用于CSV导出）
         self.detailed_results = []
-        
+
+        # 新增：图表惰性渲染状态（结果哈希 + 待渲染的脏选项卡集合）
+        self._last_results_hash = None
+        self._pending_chart_results = None
+        self._dirty_chart_tabs = set()
+        self._built_chart_tabs = set()  # 画布已构建的选项卡
+
+        # 新增：分析结果LRU缓存（键为图像内容哈希+分析参数，最多4条）
+        self._analysis_cache = OrderedDict()
+
+        # 新增：直方图artist缓存（首绘后复用，更新时只改几何数据）
+        self._hist_bars = None
+
+        # 新增：图表渲染防抖定时器——分析完成后先把控制权交还事件循环，
+        # 50ms内的连续更新请求只触发一次实际重绘
+        self._chart_update_timer = QTimer(self)
+        self._chart_update_timer.setSingleShot(True)
+        self._chart_update_timer.setInterval(50)
+        self._chart_update_timer.timeout.connect(
+            lambda: self._render_chart_tab(self.tab_widget.currentIndex()))
+
         self.setup_fonts()
         self.initUI()
     
@@ -170,10 +286,6 @@ class StoneAnalysisDemo(QMainWindow):
         self.small_font = QFont("Segoe UI", 12, QFont.Normal)  # 从9增大到12
         self.data_font = QFont("Segoe UI", 15, QFont.Medium)  # 从12增大到15
         self.button_font = QFont("Segoe UI", 14, QFont.Medium)  # 从11增大到14
-        
-        # 设置matplotlib字体
-        plt.rcParams['font.family'] = ['Segoe UI', 'DejaVu Sans', 'sans-serif']
-        plt.rcParams['axes.unicode_minus'] = False
     
     def initUI(self):
         """初始化用户界面"""
@@ -216,8 +328,24 @@ class StoneAnalysisDemo(QMainWindow):
             QPushButton:pressed { 
                 background-color: #3d8b40; 
             }
-            QPushButton:disabled { 
-                background-color: #cccccc; 
+            QPushButton:disabled {
+                background-color: #cccccc;
+                color: #888888;
+            }
+            QPushButton[kind="settings"] { background-color: #17a2b8; }
+            QPushButton[kind="settings"]:hover { background-color: #138496; }
+            QPushButton[kind="settings"]:pressed { background-color: #117a8b; }
+            QPushButton[kind="batch"] { background-color: #fd7e14; }
+            QPushButton[kind="batch"]:hover { background-color: #e8690b; }
+            QPushButton[kind="batch"]:pressed { background-color: #d35400; }
+            QPushButton[kind="export"] { background-color: #28a745; }
+            QPushButton[kind="export"]:hover { background-color: #218838; }
+            QPushButton[kind="export"]:pressed { background-color: #1e7e34; }
+            QPushButton[kind="calibration"] { background-color: #6f42c1; }
+            QPushButton[kind="calibration"]:hover { background-color: #5a32a3; }
+            QPushButton[kind="calibration"]:pressed { background-color: #4c2a85; }
+            QPushButton[kind]:disabled {
+                background-color: #cccccc;
                 color: #888888;
             }
             QGroupBox {
@@ -317,102 +445,27 @@ class StoneAnalysisDemo(QMainWindow):
         # 新增：参数设置按钮
         self.settings_btn = QPushButton('⚙️ Настройка параметров')
         self.settings_btn.setFont(self.button_font)
-        self.settings_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #17a2b8;
-                color: white;
-                border: none;
-                padding: 14px 28px;
-                border-radius: 8px;
-                font-size: 15px;
-                font-weight: 500;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                min-height: 20px;
-            }
-            QPushButton:hover { 
-                background-color: #138496; 
-            }
-            QPushButton:pressed { 
-                background-color: #117a8b; 
-            }
-        """)
+        # 颜色差异统一由应用级样式表的属性选择器描述（见_get_stylesheet）
+        self.settings_btn.setProperty("kind", "settings")
         self.settings_btn.clicked.connect(self.open_settings_dialog)
         
         # 新增：批量处理按钮
         self.batch_btn = QPushButton('📁 Пакетная обработка')
         self.batch_btn.setFont(self.button_font)
-        self.batch_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #fd7e14;
-                color: white;
-                border: none;
-                padding: 14px 28px;
-                border-radius: 8px;
-                font-size: 15px;
-                font-weight: 500;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                min-height: 20px;
-            }
-            QPushButton:hover { 
-                background-color: #e8690b; 
-            }
-            QPushButton:pressed { 
-                background-color: #d35400; 
-            }
-        """)
+        self.batch_btn.setProperty("kind", "batch")
         self.batch_btn.clicked.connect(self.batch_process_images)
         
         # 新增：导出CSV按钮
         self.export_btn = QPushButton('💾 Экспорт в CSV')
         self.export_btn.setFont(self.button_font)
-        self.export_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                padding: 14px 28px;
-                border-radius: 8px;
-                font-size: 15px;
-                font-weight: 500;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                min-height: 20px;
-            }
-            QPushButton:hover { 
-                background-color: #218838; 
-            }
-            QPushButton:pressed { 
-                background-color: #1e7e34; 
-            }
-            QPushButton:disabled { 
-                background-color: #cccccc; 
-                color: #888888;
-            }
-        """)
+        self.export_btn.setProperty("kind", "export")
         self.export_btn.clicked.connect(self.export_to_csv)
         self.export_btn.setEnabled(False)  # 默认禁用
         
         # 新增：单位标定按钮
         self.calibration_btn = QPushButton('📏 Калибровка')
         self.calibration_btn.setFont(self.button_font)
-        self.calibration_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6f42c1;
-                color: white;
-                border: none;
-                padding: 14px 28px;
-                border-radius: 8px;
-                font-size: 15px;
-                font-weight: 500;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                min-height: 20px;
-            }
-            QPushButton:hover { 
-                background-color: #5a32a3; 
-            }
-            QPushButton:pressed { 
-                background-color: #4c2a85; 
-            }
-        """)
+        self.calibration_btn.setProperty("kind", "calibration")
         self.calibration_btn.clicked.connect(self.open_calibration_dialog)
         
         second_row_layout.addWidget(self.settings_btn)
@@ -551,6 +604,9 @@ class StoneAnalysisDemo(QMainWindow):
         self._create_comparison_tab()
         self._create_report_tab()
         
+        # 切换选项卡时按需渲染被标记为脏的图表
+        self.tab_widget.currentChanged.connect(self._render_chart_tab)
+
         layout.addWidget(self.tab_widget)
         parent.addWidget(analysis_widget)
     
@@ -671,14 +727,23 @@ class StoneAnalysisDemo(QMainWindow):
         chart_group.setFont(self.title_font)
         chart_layout = QVBoxLayout(chart_group)
         chart_layout.setContentsMargins(15, 25, 15, 15)
-        
-        self.figure = Figure(figsize=(8, 6), dpi=100)
+
+        # 画布延迟到首次查看该选项卡时构建（见_build_chart_canvas）
+        self._chart_layout = chart_layout
+
+        return chart_group
+
+    def _build_chart_canvas(self):
+        """首次查看图表选项卡时构建直方图画布"""
+        _ensure_matplotlib()
+        # constrained_layout在构建时一次性接管布局，更新路径不再跑tight_layout求解器
+        self.figure = Figure(figsize=(8, 6), dpi=100, constrained_layout=True)
         self.figure.patch.set_facecolor('white')
+        # Axes只创建一次，更新时复用（避免每次分析重建整个artist树）
+        self.chart_ax = self.figure.add_subplot(1, 1, 1)
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setMinimumHeight(300)
-        chart_layout.addWidget(self.canvas)
-        
-        return chart_group
+        self._chart_layout.addWidget(self.canvas)
     
     def _create_pie_chart_tab(self):
         """创建饼图选项卡页面"""
@@ -691,16 +756,22 @@ class StoneAnalysisDemo(QMainWindow):
         pie_group.setFont(self.title_font)
         pie_layout = QVBoxLayout(pie_group)
         pie_layout.setContentsMargins(15, 25, 15, 15)
-        
-        self.pie_figure = Figure(figsize=(8, 6), dpi=100)
+
+        self._pie_layout = pie_layout
+
+        layout.addWidget(pie_group)
+
+        self.tab_widget.addTab(pie_widget, "🥧 Круговая")
+
+    def _build_pie_canvas(self):
+        """首次查看饼图选项卡时构建画布"""
+        _ensure_matplotlib()
+        self.pie_figure = Figure(figsize=(8, 6), dpi=100, constrained_layout=True)
         self.pie_figure.patch.set_facecolor('white')
+        self.pie_ax = self.pie_figure.add_subplot(1, 1, 1)
         self.pie_canvas = FigureCanvas(self.pie_figure)
         self.pie_canvas.setMinimumHeight(400)
-        pie_layout.addWidget(self.pie_canvas)
-        
-        layout.addWidget(pie_group)
-        
-        self.tab_widget.addTab(pie_widget, "🥧 Круговая")
+        self._pie_layout.addWidget(self.pie_canvas)
     
     def _create_scatter_plot_tab(self):
         """创建散点图选项卡页面"""
@@ -713,16 +784,23 @@ class StoneAnalysisDemo(QMainWindow):
         scatter_group.setFont(self.title_font)
         scatter_layout = QVBoxLayout(scatter_group)
         scatter_layout.setContentsMargins(15, 25, 15, 15)
-        
-        self.scatter_figure = Figure(figsize=(8, 6), dpi=100)
+
+        self._scatter_layout = scatter_layout
+
+        layout.addWidget(scatter_group)
+
+        self.tab_widget.addTab(scatter_widget, "📊 Рассеяние")
+
+    def _build_scatter_canvas(self):
+        """首次查看散点图选项卡时构建画布"""
+        _ensure_matplotlib()
+        self.scatter_figure = Figure(figsize=(8, 6), dpi=100, constrained_layout=True)
         self.scatter_figure.patch.set_facecolor('white')
+        self.scatter_ax = self.scatter_figure.add_subplot(1, 1, 1)
+        self.scatter_cbar = None  # 颜色条在更新时创建/替换
         self.scatter_canvas = FigureCanvas(self.scatter_figure)
         self.scatter_canvas.setMinimumHeight(400)
-        scatter_layout.addWidget(self.scatter_canvas)
-        
-        layout.addWidget(scatter_group)
-        
-        self.tab_widget.addTab(scatter_widget, "📊 Рассеяние")
+        self._scatter_layout.addWidget(self.scatter_canvas)
     
     def _create_box_plot_tab(self):
         """创建箱线图选项卡页面"""
@@ -735,16 +813,22 @@ class StoneAnalysisDemo(QMainWindow):
         box_group.setFont(self.title_font)
         box_layout = QVBoxLayout(box_group)
         box_layout.setContentsMargins(15, 25, 15, 15)
-        
-        self.box_figure = Figure(figsize=(8, 6), dpi=100)
+
+        self._box_layout = box_layout
+
+        layout.addWidget(box_group)
+
+        self.tab_widget.addTab(box_widget, "📦 Ящичная")
+
+    def _build_box_canvas(self):
+        """首次查看箱线图选项卡时构建画布"""
+        _ensure_matplotlib()
+        self.box_figure = Figure(figsize=(8, 6), dpi=100, constrained_layout=True)
         self.box_figure.patch.set_facecolor('white')
+        self.box_ax = self.box_figure.add_subplot(1, 1, 1)
         self.box_canvas = FigureCanvas(self.box_figure)
         self.box_canvas.setMinimumHeight(400)
-        box_layout.addWidget(self.box_canvas)
-        
-        layout.addWidget(box_group)
-        
-        self.tab_widget.addTab(box_widget, "📦 Ящичная")
+        self._box_layout.addWidget(self.box_canvas)
     
     def _create_comparison_tab(self):
         """创建对比分析选项卡页面"""
@@ -757,20 +841,45 @@ class StoneAnalysisDemo(QMainWindow):
         comparison_group.setFont(self.title_font)
         comparison_layout = QVBoxLayout(comparison_group)
         comparison_layout.setContentsMargins(15, 25, 15, 15)
-        
+
+        self._comparison_layout = comparison_layout
+
+        layout.addWidget(comparison_group)
+
+        self.tab_widget.addTab(comparison_widget, "⚖️ Сравнение")
+
+    def _build_comparison_canvas(self):
+        """首次查看对比分析选项卡时构建画布"""
+        _ensure_matplotlib()
         self.comparison_figure = Figure(figsize=(10, 8), dpi=100)
         self.comparison_figure.patch.set_facecolor('white')
+        # 2x2子图布局只构建一次，更新时逐个clear复用
+        gs = self.comparison_figure.add_gridspec(2, 2, hspace=0.45, wspace=0.35,
+                                                 top=0.92, bottom=0.08, left=0.08, right=0.95)
+        self.comparison_axes = (self.comparison_figure.add_subplot(gs[0, 0]),
+                                self.comparison_figure.add_subplot(gs[0, 1]),
+                                self.comparison_figure.add_subplot(gs[1, 0]),
+                                self.comparison_figure.add_subplot(gs[1, 1]))
         self.comparison_canvas = FigureCanvas(self.comparison_figure)
         self.comparison_canvas.setMinimumHeight(500)
-        comparison_layout.addWidget(self.comparison_canvas)
-        
-        layout.addWidget(comparison_group)
-        
-        self.tab_widget.addTab(comparison_widget, "⚖️ Сравнение")
+        self._comparison_layout.addWidget(self.comparison_canvas)
     
 
     
     # 事件处理方法
+    def _make_preview(self, image, label):
+        """预先将大图降采样到标签尺寸，避免Qt在全分辨率缓冲上反复缩放"""
+        h, w = image.shape[:2]
+        label_w = max(label.width(), 1)
+        label_h = max(label.height(), 1)
+
+        if w <= label_w and h <= label_h:
+            return image
+
+        scale = min(label_w / w, label_h / h)
+        new_size = (max(int(w * scale), 1), max(int(h * scale), 1))
+        return cv2.resize(image, new_size, interpolation=cv2.INTER_AREA)
+
     def load_image(self):
         """加载图像文件"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -786,17 +895,24 @@ class StoneAnalysisDemo(QMainWindow):
                     QMessageBox.critical(self, "Ошибка", error_msg)
                     return
                 
-                # 读取图像
-                img_np = np.fromfile(file_path, dtype=np.uint8)
-                self.current_image = cv2.imdecode(img_np, cv2.IMREAD_COLOR)
-                
+                # 读取图像：优先走cv2.imread的C++文件IO路径（只分配解码缓冲区）
+                self.current_image = cv2.imread(file_path, cv2.IMREAD_COLOR)
+                if self.current_image is None and any(ord(c) > 127 for c in file_path):
+                    # Windows上非ASCII路径imread会失败，退回fromfile+imdecode
+                    img_np = np.fromfile(file_path, dtype=np.uint8)
+                    self.current_image = cv2.imdecode(img_np, cv2.IMREAD_COLOR)
+
                 if self.current_image is not None:
+                    # 确保缓冲区连续，便于QImage零拷贝包装
+                    self.current_image = np.ascontiguousarray(self.current_image)
                     # 保存当前图像路径
                     self.current_image_path = file_path
-                    # 保存原始图像用于报告
-                    self.original_image = self.current_image.copy()
+                    # 保存原始图像引用用于报告（报告只读不修改，无需复制）
+                    self.original_image = self.current_image
                     
-                    display_image_in_label(self.current_image, self.original_label)
+                    # 缓存降采样后的预览图，显示路径不再搬运全分辨率像素
+                    self.preview_image = self._make_preview(self.current_image, self.original_label)
+                    display_image_in_label(self.preview_image, self.original_label)
                     self.analyze_btn.setEnabled(True)
                     self.reset_btn.setEnabled(True)
                     self.statusBar().showMessage(f'Загружено: {file_path.split("/")[-1]}')
@@ -809,14 +925,15 @@ class StoneAnalysisDemo(QMainWindow):
     def load_demo_sample(self):
         """加载演示样本"""
         try:
-            demo_image = create_demo_image()
+            demo_image = np.ascontiguousarray(create_demo_image())
             self.current_image = demo_image
             # 设置演示样本的路径信息
             self.current_image_path = "demo_sample.png"
-            # 保存原始图像用于报告
-            self.original_image = demo_image.copy()
+            # 保存原始图像引用用于报告（报告只读不修改，无需复制）
+            self.original_image = demo_image
             
-            display_image_in_label(demo_image, self.original_label)
+            self.preview_image = self._make_preview(demo_image, self.original_label)
+            display_image_in_label(self.preview_image, self.original_label)
             self.analyze_btn.setEnabled(True)
             self.reset_btn.setEnabled(True)
             self.statusBar().showMessage('Загружен демо-образец для контурного анализа')
@@ -827,16 +944,22 @@ class StoneAnalysisDemo(QMainWindow):
         """重置分析结果"""
         if self.current_image is not None:
             # 重置显示为原始图像
-            display_image_in_label(self.current_image, self.result_label)
+            display_image_in_label(self._make_preview(self.current_image, self.result_label),
+                                   self.result_label)
             
             # 重置统计信息
             for label in self.stats.values():
                 label.setText("--")
             
-            # 清空图表
-            self.figure.clear()
-            self.canvas.draw()
-            
+            # 清空图表并重置渲染缓存，保证下次分析强制重绘
+            if 1 in self._built_chart_tabs:
+                self.chart_ax.clear()
+                self.canvas.draw_idle()
+            self._hist_bars = None
+            self._last_results_hash = None
+            self._pending_chart_results = None
+            self._dirty_chart_tabs = set()
+
             # 重置报告
             self.report_text.setPlainText("Анализ сброшен. Нажмите 'Контурный анализ' для повторного анализа.")
             
@@ -852,14 +975,29 @@ class StoneAnalysisDemo(QMainWindow):
             self.statusBar().showMessage('Выполняется контурный анализ...')
             QApplication.processEvents()
             
-            # 新增：使用用户设置的参数执行核心轮廓分析
-            contour_results = perform_contour_analysis(
-                self.current_image,
-                canny_t1=self.analysis_params['canny_t1'],
-                canny_t2=self.analysis_params['canny_t2'],
-                min_area=self.analysis_params['min_area']
+            # 图像内容哈希+参数作为缓存键，重复点击分析时直接复用缓存结果
+            cache_key = (
+                hashlib.blake2b(self.current_image.tobytes(), digest_size=8).digest(),
+                self.analysis_params['canny_t1'],
+                self.analysis_params['canny_t2'],
+                self.analysis_params['min_area']
             )
-            
+            contour_results = self._analysis_cache.get(cache_key)
+            if contour_results is not None:
+                self._analysis_cache.move_to_end(cache_key)
+            else:
+                # 新增：使用用户设置的参数执行核心轮廓分析
+                contour_results = perform_contour_analysis(
+                    self.current_image,
+                    canny_t1=self.analysis_params['canny_t1'],
+                    canny_t2=self.analysis_params['canny_t2'],
+                    min_area=self.analysis_params['min_area']
+                )
+                self._analysis_cache[cache_key] = contour_results
+                if len(self._analysis_cache) > 4:
+                    self._analysis_cache.popitem(last=False)
+
+
             # 新增：存储详细结果用于CSV导出
             self.detailed_results = contour_results.get('detailed_contours', [])
             
@@ -868,7 +1006,8 @@ class StoneAnalysisDemo(QMainWindow):
             
             # 创建并显示结果图像
             processed_img = create_contour_result_image(self.current_image, contour_results)
-            display_image_in_label(processed_img, self.result_label)
+            display_image_in_label(self._make_preview(processed_img, self.result_label),
+                                   self.result_label)
             
             # 新增：启用导出按钮
             self.export_btn.setEnabled(True)
@@ -878,152 +1017,248 @@ class StoneAnalysisDemo(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Ошибка анализа", f"Ошибка в процессе контурного анализа: {str(e)}")
     
+    # 选项卡索引 -> 图表更新方法（摘要和报告选项卡不含matplotlib画布）
+    _CHART_TAB_UPDATERS = {
+        1: 'update_contour_charts',
+        2: 'update_pie_chart',
+        3: 'update_scatter_plot',
+        4: 'update_box_plot',
+        5: 'update_comparison_chart',
+    }
+
+    # 选项卡索引 -> 画布构建方法（首次查看时才实例化Figure+FigureCanvas）
+    _CHART_TAB_BUILDERS = {
+        1: '_build_chart_canvas',
+        2: '_build_pie_canvas',
+        3: '_build_scatter_canvas',
+        4: '_build_box_canvas',
+        5: '_build_comparison_canvas',
+    }
+
     def update_analysis_display(self, contour_results):
         """更新分析结果显示"""
+        # 结果未变化时跳过全部重绘（BLAKE2b整体哈希详细结果数组）
+        results_hash = hashlib.blake2b(
+            contour_results['detailed_contours'].tobytes(), digest_size=8).digest()
+        if results_hash == self._last_results_hash:
+            return
+        self._last_results_hash = results_hash
+
+        # 分析阶段已返回SoA数组，这里只做一次显示单位换算，
+        # 不再重复任何cv2逐轮廓调用
+        areas_px = contour_results["areas"]
+        perims_px = contour_results["perimeters"]
+        contour_results["_areas_px"] = areas_px
+        contour_results["_perims_px"] = perims_px
+        self._refresh_display_units()
+        contour_results["_areas_disp"] = areas_px * self._area_factor
+        contour_results["_perims_disp"] = perims_px * self._len_factor
+        contour_results["_area_unit"] = self._area_unit
+        contour_results["_length_unit"] = self._len_unit
+
+        # 等效直径与面积标准差整条数组一次算出，供报告直接取用
+        areas_disp = contour_results["_areas_disp"]
+        contour_results["_eq_diams_disp"] = np.sqrt(4.0 * areas_disp / np.pi)
+        contour_results["_std_area_disp"] = float(areas_disp.std()) if len(areas_disp) > 0 else 0.0
+
         # 更新统计信息
         self.stats["Общее количество контуров"].setText(str(contour_results["contour_count"]))
         self.stats["Площадь максимального контура"].setText(format_area_value(contour_results['largest_area']))
         self.stats["Периметр максимального контура"].setText(format_perimeter_value(contour_results['largest_perimeter']))
         self.stats["Отношение площадей"].setText(format_percentage_value(contour_results['area_ratio']))
-        
-        # 更新图表
-        self.update_contour_charts(contour_results)
-        
-        # 更新新增的图表
-        self.update_pie_chart(contour_results)
-        self.update_scatter_plot(contour_results)
-        self.update_box_plot(contour_results)
-        self.update_comparison_chart(contour_results)
-        
+
+        # 空结果统一在此短路：清空全部图表后只更新报告，
+        # 各图表方法不再需要自己的判空分支
+        if not contour_results["all_contours"]:
+            self._clear_all_charts()
+            self.update_contour_report(contour_results)
+            return
+
+        # 图表惰性渲染：只绘制当前可见选项卡，其余标脏待切换时再绘；
+        # 经防抖定时器异步触发，不在分析调用栈内同步阻塞
+        self._pending_chart_results = contour_results
+        self._dirty_chart_tabs = set(self._CHART_TAB_UPDATERS)
+        self._chart_update_timer.start()
+
         # 更新报告
         self.update_contour_report(contour_results)
-    
+
+    def _clear_all_charts(self):
+        """清空所有已构建的图表画布（空结果时的统一处理）"""
+        self._pending_chart_results = None
+        self._dirty_chart_tabs = set()
+        self._hist_bars = None
+        if 1 in self._built_chart_tabs:
+            self.chart_ax.clear()
+            self.canvas.draw_idle()
+        if 2 in self._built_chart_tabs:
+            self.pie_ax.clear()
+            self.pie_canvas.draw_idle()
+        if 3 in self._built_chart_tabs:
+            if self.scatter_cbar is not None:
+                self.scatter_cbar.remove()
+                self.scatter_cbar = None
+            self.scatter_ax.clear()
+            self.scatter_canvas.draw_idle()
+        if 4 in self._built_chart_tabs:
+            self.box_ax.clear()
+            self.box_canvas.draw_idle()
+        if 5 in self._built_chart_tabs:
+            for ax in self.comparison_axes:
+                ax.clear()
+            self.comparison_canvas.draw_idle()
+
+    def _render_chart_tab(self, index):
+        """按需渲染指定选项卡的图表（仅当其被标记为脏时）"""
+        # 首次查看时先构建该选项卡的画布
+        if index in self._CHART_TAB_BUILDERS and index not in self._built_chart_tabs:
+            getattr(self, self._CHART_TAB_BUILDERS[index])()
+            self._built_chart_tabs.add(index)
+        if index not in self._dirty_chart_tabs or self._pending_chart_results is None:
+            return
+        self._dirty_chart_tabs.discard(index)
+        getattr(self, self._CHART_TAB_UPDATERS[index])(self._pending_chart_results)
+
+
     def update_contour_charts(self, contour_results):
         """更新轮廓分析图表"""
-        self.figure.clear()
-        
-        # 创建面积分布直方图
-        ax = self.figure.add_subplot(1, 1, 1)
-        
-        # 从轮廓计算面积
-        contour_areas = [cv2.contourArea(cnt) for cnt in contour_results["all_contours"]]
-        if contour_areas:
-            # 根据标定比例转换单位
-            if self.scale_ratio > 1.0:
-                # 转换为物理单位
-                areas_display = [area / (self.scale_ratio ** 2) for area in contour_areas]
-                largest_area_display = contour_results["largest_area"] / (self.scale_ratio ** 2)
-                second_largest_area_display = contour_results["second_largest_area"] / (self.scale_ratio ** 2)
-                area_unit = 'mm²'
-            else:
-                # 保持像素单位
-                areas_display = contour_areas
-                largest_area_display = contour_results["largest_area"]
-                second_largest_area_display = contour_results["second_largest_area"]
-                area_unit = 'px²'
-            
-            # 创建直方图
-            n, bins, patches = ax.hist(areas_display, bins=20, alpha=0.7, 
-                                     color='#6c757d', edgecolor='white')
-            
-            # 标记最大面积（红色）
-            ax.axvline(x=largest_area_display, color='#dc3545', linestyle='--', linewidth=2,
-                      label=f'Максимальная площадь: {largest_area_display:.1f} {area_unit}')
-            
-            # 标记第二大面积（蓝色）
-            if second_largest_area_display > 0:
-                ax.axvline(x=second_largest_area_display, color='#007bff', linestyle='--', linewidth=2,
-                          label=f'Вторая по величине: {second_largest_area_display:.1f} {area_unit}')
-            
-            ax.set_xlabel(f"Площадь контура ({area_unit})", fontdict={'family': 'Segoe UI', 'size': 13})
-            ax.set_ylabel("Количество контуров", fontdict={'family': 'Segoe UI', 'size': 13})
-            ax.set_title("Распределение площадей контуров",
-                        fontdict={'family': 'Segoe UI', 'size': 14, 'weight': 'bold'})
-            ax.legend()
+        # 复用已有Axes绘制面积分布直方图
+        ax = self.chart_ax
+
+        # 面积数组在update_analysis_display中统一预计算（空结果已在上游短路）
+        areas_display = contour_results["_areas_disp"]
+        area_unit = contour_results["_area_unit"]
+        # 单位换算直接乘预计算系数，不再分支
+        largest_area_display = contour_results["largest_area"] * self._area_factor
+        second_largest_area_display = contour_results["second_largest_area"] * self._area_factor
+
+        # 先用np.histogram分桶，再按桶渲染，绘制耗时与轮廓数无关
+        counts, edges = np.histogram(areas_display, bins=20)
+        widths = np.diff(edges)
+
+        largest_label = f'Максимальная площадь: {largest_area_display:.1f} {area_unit}'
+        second_label = f'Вторая по величине: {second_largest_area_display:.1f} {area_unit}'
+
+        if getattr(self, '_hist_bars', None) is None:
+            # 首次绘制创建全部artist；后续更新只改几何数据，不重建artist树
+            self._hist_bars = ax.bar(edges[:-1], counts, width=widths, alpha=0.7,
+                                     color='#6c757d', edgecolor='white', align='edge')
+            # 标记最大面积（红色）与第二大面积（蓝色）
+            self._vline_largest = ax.axvline(x=largest_area_display, color='#dc3545',
+                                             linestyle='--', linewidth=2, label=largest_label)
+            self._vline_second = ax.axvline(x=second_largest_area_display, color='#007bff',
+                                            linestyle='--', linewidth=2, label=second_label)
+            ax.set_ylabel("Количество контуров", fontdict=_FONT_HIST_AX)
+            ax.set_title("Распределение площадей контуров", fontdict=_FONT_HIST_TITLE)
             ax.grid(True, alpha=0.3, linestyle='--')
             ax.set_facecolor('#fafbfc')
-        
-        self.figure.tight_layout()
-        self.canvas.draw()
+        else:
+            for bar, x, w, h in zip(self._hist_bars, edges[:-1], widths, counts):
+                bar.set_x(x)
+                bar.set_width(w)
+                bar.set_height(h)
+            self._vline_largest.set_xdata([largest_area_display, largest_area_display])
+            self._vline_largest.set_label(largest_label)
+            self._vline_second.set_xdata([second_largest_area_display, second_largest_area_display])
+            self._vline_second.set_label(second_label)
+            ax.relim()
+            ax.autoscale_view()
+
+        self._vline_second.set_visible(second_largest_area_display > 0)
+        ax.set_xlabel(f"Площадь контура ({area_unit})", fontdict=_FONT_HIST_AX)
+        ax.legend()
+        self.canvas.draw_idle()
     
     def update_contour_report(self, contour_results):
         """更新轮廓分析报告"""
-        # 根据标定比例转换单位
+        # 根据标定比例转换单位（复用预计算系数）
+        self._refresh_display_units()
+        largest_area_display = contour_results['largest_area'] * self._area_factor
+        largest_perimeter_display = contour_results['largest_perimeter'] * self._len_factor
+        second_largest_area_display = contour_results['second_largest_area'] * self._area_factor
+        second_largest_perimeter_display = contour_results.get('second_largest_perimeter', 0) * self._len_factor
+        total_area_display = contour_results['total_area'] * self._area_factor
+        avg_area_display = total_area_display / contour_results['contour_count'] if contour_results['contour_count'] > 0 else 0
+        area_unit = self._area_unit
+        length_unit = self._len_unit
         if self.scale_ratio > 1.0:
-            # 转换为物理单位
-            largest_area_display = contour_results['largest_area'] / (self.scale_ratio ** 2)
-            largest_perimeter_display = contour_results['largest_perimeter'] / self.scale_ratio
-            second_largest_area_display = contour_results['second_largest_area'] / (self.scale_ratio ** 2)
-            second_largest_perimeter_display = contour_results.get('second_largest_perimeter', 0) / self.scale_ratio
-            total_area_display = contour_results['total_area'] / (self.scale_ratio ** 2)
-            avg_area_display = total_area_display / contour_results['contour_count'] if contour_results['contour_count'] > 0 else 0
-            area_unit = 'mm²'
-            length_unit = 'mm'
             scale_info = f"\n📏 КАЛИБРОВКА: 1 мм = {self.scale_ratio:.2f} пикселей"
         else:
-            # 保持像素单位
-            largest_area_display = contour_results['largest_area']
-            largest_perimeter_display = contour_results['largest_perimeter']
-            second_largest_area_display = contour_results['second_largest_area']
-            second_largest_perimeter_display = contour_results.get('second_largest_perimeter', 0)
-            total_area_display = contour_results['total_area']
-            avg_area_display = total_area_display / contour_results['contour_count'] if contour_results['contour_count'] > 0 else 0
-            area_unit = 'px²'
-            length_unit = 'px'
             scale_info = ""
-        
+
         # 计算第二大轮廓的面积占比
         second_area_ratio = 0
         if contour_results['total_area'] > 0:
             second_area_ratio = (contour_results['second_largest_area'] / contour_results['total_area']) * 100
-        
-        # 生成详细的专业技术报告
+
+        # 派生指标先算入局部变量（零分母时置0，不再无条件做除法）；
+        # 等效直径优先读update_analysis_display预计算的向量
+        eq_diams = contour_results.get("_eq_diams_disp")
+        areas_disp = contour_results.get("_areas_disp")
+        if eq_diams is not None and len(eq_diams) > 0:
+            eq_diam_largest = float(eq_diams[np.argmax(areas_disp)])
+        else:
+            eq_diam_largest = math.sqrt(4 * largest_area_display / math.pi)
+        eq_diam_second = math.sqrt(4 * second_largest_area_display / math.pi)
+        std_area_display = contour_results.get("_std_area_disp", 0.0)
+        uniformity = largest_area_display / avg_area_display if avg_area_display > 0 else 0
+        top_ratio = (largest_area_display / second_largest_area_display
+                     if second_largest_area_display > 0 else 0)
+        if contour_results['area_ratio'] > 15:
+            heterogeneity = 'высокую'
+        elif contour_results['area_ratio'] > 8:
+            heterogeneity = 'умеренную'
+        else:
+            heterogeneity = 'низкую'
+
+        # 生成详细的专业技术报告（分段拼接后一次join，避免重复构造整块大字符串）
         from datetime import datetime
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        report = f"""📊 ТЕХНИЧЕСКИЙ ОТЧЕТ ПО АНАЛИЗУ ФРАКЦИЙ ЩЕБНЯ
+
+        parts = []
+        parts.append(f"""📊 ТЕХНИЧЕСКИЙ ОТЧЕТ ПО АНАЛИЗУ ФРАКЦИЙ ЩЕБНЯ
 {'═' * 80}
 
 📋 ОБЩАЯ ИНФОРМАЦИЯ:
   • Дата и время анализа: {current_time}
   • Файл изображения: {os.path.basename(self.current_image_path) if hasattr(self, 'current_image_path') else 'Неизвестно'}
-  • Разрешение изображения: {self.original_image.shape[1]}×{self.original_image.shape[0]} пикселей{scale_info}
+  • Разрешение изображения: {self.original_image.shape[1]}×{self.original_image.shape[0]} пикселей{scale_info}""")
 
-🔬 ПАРАМЕТРЫ АЛГОРИТМА:
+        parts.append(f"""🔬 ПАРАМЕТРЫ АЛГОРИТМА:
   • Метод обнаружения контуров: Двухэтапный анализ
     - Этап 1: Пороговая обработка (THRESH_BINARY + OTSU)
     - Этап 2: Детектор границ Canny
   • Пороги Canny: Нижний={self.analysis_params['canny_t1']}, Верхний={self.analysis_params['canny_t2']}
   • Минимальная площадь фильтрации: {self.analysis_params['min_area']} пикселей
   • Метод аппроксимации контуров: CHAIN_APPROX_SIMPLE
-  • Морфологические операции: Применены для улучшения качества
+  • Морфологические операции: Применены для улучшения качества""")
 
-📊 РЕЗУЛЬТАТЫ КОЛИЧЕСТВЕННОГО АНАЛИЗА:
+        parts.append(f"""📊 РЕЗУЛЬТАТЫ КОЛИЧЕСТВЕННОГО АНАЛИЗА:
   • Общее количество обнаруженных контуров: {contour_results['contour_count']}
   • Суммарная площадь всех фракций: {total_area_display:.2f} {area_unit}
   • Средняя площадь фракции: {avg_area_display:.2f} {area_unit}
-  • Стандартное отклонение площадей: Требует дополнительного расчета
+  • Стандартное отклонение площадей: {std_area_display:.2f} {area_unit}""")
 
-🎯 АНАЛИЗ ДОМИНИРУЮЩИХ ФРАКЦИЙ:
+        parts.append(f"""🎯 АНАЛИЗ ДОМИНИРУЮЩИХ ФРАКЦИЙ:
 
 🔴 КРУПНЕЙШАЯ ФРАКЦИЯ (выделена красным цветом):
   • Площадь поверхности: {largest_area_display:.2f} {area_unit}
   • Периметр: {largest_perimeter_display:.2f} {length_unit}
   • Процентная доля от общей площади: {contour_results['area_ratio']:.2f}%
-  • Эквивалентный диаметр: {(4 * largest_area_display / 3.14159) ** 0.5:.2f} {length_unit}
+  • Эквивалентный диаметр: {eq_diam_largest:.2f} {length_unit}
 
 🔵 ВТОРАЯ ПО РАЗМЕРУ ФРАКЦИЯ (выделена синим цветом):
   • Площадь поверхности: {second_largest_area_display:.2f} {area_unit}
   • Периметр: {second_largest_perimeter_display:.2f} {length_unit}
   • Процентная доля от общей площади: {second_area_ratio:.2f}%
-  • Эквивалентный диаметр: {(4 * second_largest_area_display / 3.14159) ** 0.5:.2f} {length_unit}
+  • Эквивалентный диаметр: {eq_diam_second:.2f} {length_unit}""")
 
-📈 СТАТИСТИЧЕСКИЙ АНАЛИЗ РАСПРЕДЕЛЕНИЯ:
-  • Коэффициент неоднородности: {(largest_area_display / avg_area_display):.2f}
-  • Отношение крупнейшей к второй фракции: {(largest_area_display / second_largest_area_display):.2f}
-  • Индекс концентрации (топ-2 фракции): {(contour_results['area_ratio'] + second_area_ratio):.1f}%
+        parts.append(f"""📈 СТАТИСТИЧЕСКИЙ АНАЛИЗ РАСПРЕДЕЛЕНИЯ:
+  • Коэффициент неоднородности: {uniformity:.2f}
+  • Отношение крупнейшей к второй фракции: {top_ratio:.2f}
+  • Индекс концентрации (топ-2 фракции): {(contour_results['area_ratio'] + second_area_ratio):.1f}%""")
 
-🎨 СИСТЕМА ЦВЕТОВОГО КОДИРОВАНИЯ:
+        parts.append("""🎨 СИСТЕМА ЦВЕТОВОГО КОДИРОВАНИЯ:
   🔴 Красный контур - максимальная площадь (доминирующая фракция)
   🔵 Синий контур - вторая по величине площадь
   ⚪ Тонкие красные линии - все остальные обнаруженные контуры
@@ -1031,13 +1266,13 @@ class StoneAnalysisDemo(QMainWindow):
 🔍 КАЧЕСТВО ОБРАБОТКИ:
   • Четкость границ: Высокая (алгоритм Canny)
   • Точность сегментации: Оптимизирована для щебня
-  • Устойчивость к шумам: Морфологическая фильтрация применена
+  • Устойчивость к шумам: Морфологическая фильтрация применена""")
 
-📋 ТЕХНИЧЕСКОЕ ЗАКЛЮЧЕНИЕ:
-Анализ фракционного состава щебня успешно завершен. Обнаружено 
-{contour_results['contour_count']} отдельных фракций. Доминирующая фракция 
-составляет {contour_results['area_ratio']:.2f}% от общей площади образца, 
-что указывает на {'высокую' if contour_results['area_ratio'] > 15 else 'умеренную' if contour_results['area_ratio'] > 8 else 'низкую'} 
+        parts.append(f"""📋 ТЕХНИЧЕСКОЕ ЗАКЛЮЧЕНИЕ:
+Анализ фракционного состава щебня успешно завершен. Обнаружено
+{contour_results['contour_count']} отдельных фракций. Доминирующая фракция
+составляет {contour_results['area_ratio']:.2f}% от общей площади образца,
+что указывает на {heterogeneity}
 степень неоднородности материала.
 
 ⚠️  ПРИМЕЧАНИЯ:
@@ -1046,9 +1281,9 @@ class StoneAnalysisDemo(QMainWindow):
   • Калибровка масштаба повышает точность измерений
 
 {'─' * 80}
-📧 Отчет сгенерирован системой компьютерного зрения v2.0"""
-        
-        self.report_text.setPlainText(report)
+📧 Отчет сгенерирован системой компьютерного зрения v2.0""")
+
+        self.report_text.setPlainText("\n\n".join(parts))
     
     # 新增：参数设置功能
     def open_settings_dialog(self):
@@ -1078,58 +1313,59 @@ class StoneAnalysisDemo(QMainWindow):
             progress.setWindowModality(Qt.WindowModal)
             progress.setMinimumDuration(0)
             
-            batch_results = []
-            
-            for i, file_path in enumerate(file_paths):
-                if progress.wasCanceled():
-                    break
-                
-                progress.setValue(i)
-                progress.setLabelText(f"Обработка: {os.path.basename(file_path)}")
-                QApplication.processEvents()
-                
-                # 读取图像
-                image = cv2.imread(file_path)
-                if image is None:
-                    continue
-                
-                # 分析图像
-                contour_results = perform_contour_analysis(
-                    image,
-                    canny_t1=self.analysis_params['canny_t1'],
-                    canny_t2=self.analysis_params['canny_t2'],
-                    min_area=self.analysis_params['min_area']
-                )
-                
-                # 存储结果
-                batch_results.append({
-                    'filename': os.path.basename(file_path),
-                    'contour_count': contour_results['contour_count'],
-                    'largest_area': contour_results['largest_area'],
-                    'largest_perimeter': contour_results['largest_perimeter'],
-                    'total_area': contour_results['total_area'],
-                    'area_ratio': contour_results['area_ratio']
-                })
-            
+            # 预分配结构化结果数组，按完成顺序填充
+            batch_results = np.empty(len(file_paths), dtype=BATCH_RESULT_DTYPE)
+            n_results = 0
+
+            # 各图像相互独立，提交到进程池并行分析，主线程只收集结果并更新进度
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = {
+                    executor.submit(_batch_analyze_file, file_path, self.analysis_params): file_path
+                    for file_path in file_paths
+                }
+
+                for i, future in enumerate(as_completed(futures)):
+                    if progress.wasCanceled():
+                        for pending in futures:
+                            pending.cancel()
+                        break
+
+                    progress.setValue(i)
+                    progress.setLabelText(f"Обработка: {os.path.basename(futures[future])}")
+                    QApplication.processEvents()
+
+                    # 单个文件失败不中断整批处理，仅跳过该文件
+                    try:
+                        result = future.result()
+                    except Exception:
+                        continue
+                    if result is not None:
+                        batch_results[n_results] = (
+                            result['filename'], result['contour_count'],
+                            result['largest_area'], result['largest_perimeter'],
+                            result['total_area'], result['area_ratio']
+                        )
+                        n_results += 1
+
             progress.setValue(len(file_paths))
-            
+
             # 显示批量处理结果
-            self.display_batch_results(batch_results)
+            self.display_batch_results(batch_results[:n_results])
             
         except Exception as e:
             QMessageBox.critical(self, "Ошибка", f"Ошибка при пакетной обработке: {str(e)}")
     
     def display_batch_results(self, batch_results):
         """显示批量处理结果"""
-        if not batch_results:
+        if len(batch_results) == 0:
             return
-        
-        # 计算汇总统计
+
+        # 汇总统计直接按列做C级归约
         total_files = len(batch_results)
-        avg_contours = np.mean([r['contour_count'] for r in batch_results])
-        avg_largest_area = np.mean([r['largest_area'] for r in batch_results])
-        max_area_file = max(batch_results, key=lambda x: x['largest_area'])
-        
+        avg_contours = batch_results['contour_count'].mean()
+        avg_largest_area = batch_results['largest_area'].mean()
+        max_area_file = batch_results[batch_results['largest_area'].argmax()]
+
         # 生成批量处理报告
         report = f"""📁 ОТЧЕТ ПАКЕТНОЙ ОБРАБОТКИ
 {'═' * 50}
@@ -1142,20 +1378,22 @@ class StoneAnalysisDemo(QMainWindow):
 
 📋 ДЕТАЛЬНЫЕ РЕЗУЛЬТАТЫ:
 """
-        
-        for result in batch_results:
-            report += f"\n🔸 {result['filename']}:\n"
-            report += f"   Контуры: {result['contour_count']}, "
-            report += f"Макс.площадь: {result['largest_area']:.0f} px², "
-            report += f"Доля: {result['area_ratio']:.1f}%\n"
-        
+
+        report += "".join(
+            f"\n🔸 {result['filename']}:\n"
+            f"   Контуры: {result['contour_count']}, "
+            f"Макс.площадь: {result['largest_area']:.0f} px², "
+            f"Доля: {result['area_ratio']:.1f}%\n"
+            for result in batch_results
+        )
+
         self.report_text.setPlainText(report)
         self.statusBar().showMessage(f'Пакетная обработка завершена: {total_files} файлов')
     
     # 新增：导出CSV功能
     def export_to_csv(self):
         """导出分析结果到CSV文件"""
-        if not self.detailed_results:
+        if len(self.detailed_results) == 0:
             QMessageBox.warning(self, "Предупреждение", "Нет данных для экспорта. Сначала выполните анализ.")
             return
         
@@ -1170,30 +1408,22 @@ class StoneAnalysisDemo(QMainWindow):
             return
         
         try:
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['ID', 'Area', 'Perimeter', 'Area_mm2', 'Perimeter_mm']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                # 写入表头
-                writer.writeheader()
-                
-                # 写入数据
-                for i, contour_data in enumerate(self.detailed_results, 1):
-                    area_px = contour_data['area']
-                    perimeter_px = contour_data['perimeter']
-                    
-                    # 转换为物理单位
-                    area_mm = area_px / (self.scale_ratio ** 2)
-                    perimeter_mm = perimeter_px / self.scale_ratio
-                    
-                    writer.writerow({
-                        'ID': i,
-                        'Area': f"{area_px:.2f}",
-                        'Perimeter': f"{perimeter_px:.2f}",
-                        'Area_mm2': f"{area_mm:.2f}",
-                        'Perimeter_mm': f"{perimeter_mm:.2f}"
-                    })
-            
+            # 按列批量组装并用np.savetxt一次性写出（C级格式化，替代逐行csv.writer）
+            self._refresh_display_units()
+            results = self.detailed_results
+            export_data = np.column_stack((
+                results['id'],
+                results['area'],
+                results['perimeter'],
+                results['area'] * self._area_factor,      # 转换为物理单位（向量化乘法）
+                results['perimeter'] * self._len_factor
+            ))
+            np.savetxt(file_path, export_data, delimiter=',',
+                       fmt=['%d', '%.2f', '%.2f', '%.2f', '%.2f'],
+                       header='ID,Area,Perimeter,Area_mm2,Perimeter_mm',
+                       comments='', encoding='utf-8')
+
+
             QMessageBox.information(self, "Успех", f"Результаты успешно экспортированы в:\n{file_path}")
             self.statusBar().showMessage(f'Данные экспортированы: {len(self.detailed_results)} контуров')
             
@@ -1227,33 +1457,51 @@ class StoneAnalysisDemo(QMainWindow):
             
             self.statusBar().showMessage(f'Калибровка: 1мм = {self.scale_ratio:.2f}px')
     
+    def _refresh_display_units(self):
+        """根据标定比例预计算单位换算系数与单位文本，供所有图表共用"""
+        if self.scale_ratio > 1.0:
+            self._area_factor = 1.0 / (self.scale_ratio ** 2)
+            self._len_factor = 1.0 / self.scale_ratio
+            self._area_unit = 'mm²'
+            self._len_unit = 'mm'
+        else:
+            self._area_factor = 1.0
+            self._len_factor = 1.0
+            self._area_unit = 'px²'
+            self._len_unit = 'px'
+
     def update_display_units(self):
         """更新显示单位"""
-        # 这里可以添加更新所有显示单位的逻辑
-        # 由于当前的显示更新在analyze_image中进行，这里主要是为了扩展性
-        pass
+        self._refresh_display_units()
+        # 标定变化后结果哈希失效，下次分析强制按新单位重绘
+        self._last_results_hash = None
     
     def update_pie_chart(self, contour_results):
         """更新饼图"""
-        self.pie_figure.clear()
-        
-        # 计算轮廓面积
-        contour_areas = [cv2.contourArea(cnt) for cnt in contour_results["all_contours"]]
-        if not contour_areas:
-            return
-        
-        # 根据面积大小分类
-        total_area = sum(contour_areas)
-        large_threshold = np.percentile(contour_areas, 75)  # 75%分位数
-        medium_threshold = np.percentile(contour_areas, 25)  # 25%分位数
-        
-        large_count = sum(1 for area in contour_areas if area >= large_threshold)
-        medium_count = sum(1 for area in contour_areas if medium_threshold <= area < large_threshold)
-        small_count = sum(1 for area in contour_areas if area < medium_threshold)
-        
-        # 创建饼图
-        ax = self.pie_figure.add_subplot(1, 1, 1)
+        self.pie_ax.clear()
+
+
+        # 面积数组在update_analysis_display中统一预计算（空结果已在上游短路）
+        contour_areas = contour_results["_areas_px"]
+
+        # 需要总覆盖面积时直接数二值掩码的非零像素，比逐轮廓contourArea求和更快
+        binary_mask = contour_results.get("binary_mask")
+        total_area = (cv2.countNonZero(binary_mask) if binary_mask is not None
+                      else contour_areas.sum())
+
+        # 根据面积大小分类（一次排序得到两个分位数和三组计数）
+        sorted_areas = np.sort(contour_areas)
+        medium_threshold, large_threshold = np.quantile(sorted_areas, [0.25, 0.75])  # 25%/75%分位数
+
+        below_medium, below_large = np.searchsorted(sorted_areas, [medium_threshold, large_threshold])
+        small_count = int(below_medium)
+        medium_count = int(below_large - below_medium)
+        large_count = int(len(sorted_areas) - below_large)
         
+        # 复用饼图Axes
+        ax = self.pie_ax
+
+
         sizes = [large_count, medium_count, small_count]
         labels = ['Крупные фракции', 'Средние фракции', 'Мелкие фракции']
         colors = ['#ff6b6b', '#4ecdc4', '#45b7d1']
@@ -1273,106 +1521,94 @@ class StoneAnalysisDemo(QMainWindow):
             autotext.set_weight('bold')
             autotext.set_fontfamily('DejaVu Sans')
         
-        ax.set_title('Распределение размеров частиц', 
-                    fontdict={'family': 'DejaVu Sans', 'size': 13, 'weight': 'bold'}, pad=15)
+        ax.set_title('Распределение размеров частиц',
+                    fontdict=_FONT_PIE_TITLE, pad=15)
         
-        self.pie_figure.tight_layout(pad=2.0)
-        self.pie_canvas.draw()
+        self.pie_canvas.draw_idle()
     
     def update_scatter_plot(self, contour_results):
         """更新散点图"""
-        self.scatter_figure.clear()
-        
-        # 计算轮廓面积和周长
-        contour_areas = [cv2.contourArea(cnt) for cnt in contour_results["all_contours"]]
-        contour_perimeters = [cv2.arcLength(cnt, True) for cnt in contour_results["all_contours"]]
-        
-        if not contour_areas:
-            return
-        
-        # 根据标定比例转换单位
-        if self.scale_ratio > 1.0:
-            areas_display = [area / (self.scale_ratio ** 2) for area in contour_areas]
-            perimeters_display = [perimeter / self.scale_ratio for perimeter in contour_perimeters]
-            area_unit = 'mm²'
-            perimeter_unit = 'mm'
-        else:
-            areas_display = contour_areas
-            perimeters_display = contour_perimeters
-            area_unit = 'px²'
-            perimeter_unit = 'px'
-        
-        # 创建散点图
-        ax = self.scatter_figure.add_subplot(1, 1, 1)
-        
-        # 根据面积大小设置颜色
-        colors = plt.cm.viridis(np.array(areas_display) / max(areas_display))
-        
-        scatter = ax.scatter(areas_display, perimeters_display, c=colors, alpha=0.6, s=50)
-        
-        ax.set_xlabel(f'Площадь ({area_unit})', fontdict={'family': 'DejaVu Sans', 'size': 11})
-        ax.set_ylabel(f'Периметр ({perimeter_unit})', fontdict={'family': 'DejaVu Sans', 'size': 11})
+        self.scatter_ax.clear()
+
+
+        # 面积/周长数组在update_analysis_display中统一预计算（空结果已在上游短路）
+        areas_display = contour_results["_areas_disp"]
+        perimeters_display = contour_results["_perims_disp"]
+        area_unit = contour_results["_area_unit"]
+        perimeter_unit = contour_results["_length_unit"]
+
+        # 复用散点图Axes
+        ax = self.scatter_ax
+
+
+        # 根据面积大小设置颜色（归一化交给scatter内部完成，不预生成N×4颜色数组）
+        from matplotlib.colors import Normalize
+        norm = Normalize(vmin=areas_display.min(), vmax=areas_display.max())
+        scatter = ax.scatter(areas_display, perimeters_display, c=areas_display,
+                             cmap='viridis', norm=norm, alpha=0.6, s=50)
+        
+        ax.set_xlabel(f'Площадь ({area_unit})', fontdict=_FONT_AX)
+        ax.set_ylabel(f'Периметр ({perimeter_unit})', fontdict=_FONT_AX)
         ax.set_title('Соотношение площади и периметра',
-                    fontdict={'family': 'DejaVu Sans', 'size': 12, 'weight': 'bold'}, pad=12)
+                    fontdict=_FONT_TITLE, pad=12)
         
-        # 添加趋势线
+        # 添加趋势线（只排序一次，C级np.sort替代两次Python sorted）
         if len(areas_display) > 1:
             z = np.polyfit(areas_display, perimeters_display, 1)
             p = np.poly1d(z)
-            ax.plot(sorted(areas_display), p(sorted(areas_display)), "r--", alpha=0.8, linewidth=2)
+            sorted_areas = np.sort(areas_display)
+            ax.plot(sorted_areas, p(sorted_areas), "r--", alpha=0.8, linewidth=2)
         
         ax.grid(True, alpha=0.3, linestyle='--')
         ax.set_facecolor('#fafbfc')
         
-        # 添加颜色条
-        cbar = self.scatter_figure.colorbar(scatter, ax=ax)
-        cbar.set_label(f'Площадь ({area_unit})', fontdict={'family': 'DejaVu Sans', 'size': 10})
-        cbar.ax.tick_params(labelsize=9)
+        # 添加颜色条（替换上一次的颜色条，避免重复累积）
+        if self.scatter_cbar is not None:
+            self.scatter_cbar.remove()
+        self.scatter_cbar = self.scatter_figure.colorbar(scatter, ax=ax)
+        self.scatter_cbar.set_label(f'Площадь ({area_unit})', fontdict=_FONT_CBAR)
+        self.scatter_cbar.ax.tick_params(labelsize=9)
         
         # 设置刻度标签字体
         ax.tick_params(axis='both', which='major', labelsize=9)
         
-        self.scatter_figure.tight_layout(pad=2.0)
-        self.scatter_canvas.draw()
+        self.scatter_canvas.draw_idle()
     
     def update_box_plot(self, contour_results):
         """更新箱线图"""
-        self.box_figure.clear()
-        
-        # 计算轮廓面积和周长
-        contour_areas = [cv2.contourArea(cnt) for cnt in contour_results["all_contours"]]
-        contour_perimeters = [cv2.arcLength(cnt, True) for cnt in contour_results["all_contours"]]
-        
-        if not contour_areas:
-            return
-        
-        # 根据标定比例转换单位
-        if self.scale_ratio > 1.0:
-            areas_display = [area / (self.scale_ratio ** 2) for area in contour_areas]
-            perimeters_display = [perimeter / self.scale_ratio for perimeter in contour_perimeters]
-            unit_suffix = ' (mm²/mm)'
-        else:
-            areas_display = contour_areas
-            perimeters_display = contour_perimeters
-            unit_suffix = ' (px²/px)'
-        
-        # 创建箱线图
-        ax = self.box_figure.add_subplot(1, 1, 1)
-        
+        self.box_ax.clear()
+
+
+        # 面积/周长数组在update_analysis_display中统一预计算（空结果已在上游短路）
+        areas_display = contour_results["_areas_disp"]
+        perimeters_display = contour_results["_perims_disp"]
+        unit_suffix = ' (mm²/mm)' if self.scale_ratio > 1.0 else ' (px²/px)'
+
+        # 复用箱线图Axes
+        ax = self.box_ax
+
         # подготовка данных
         data = [areas_display, perimeters_display]
         labels = [f'Площадь{unit_suffix}', f'Периметр{unit_suffix}']
         
         # нормализация данных для сравнения
-        normalized_areas = (np.array(areas_display) - np.mean(areas_display)) / np.std(areas_display)
-        normalized_perimeters = (np.array(perimeters_display) - np.mean(perimeters_display)) / np.std(perimeters_display)
-        
-        box_data = [normalized_areas, normalized_perimeters]
-        box_labels = ['Площадь\n(нормализованная)', 'Периметр\n(нормализованный)']
-        
+        # 标准差为0（恒定面积/周长）时直接置零，避免NaN/inf进入matplotlib慢路径
+        std_areas = areas_display.std()
+        std_perimeters = perimeters_display.std()
+        normalized_areas = ((areas_display - areas_display.mean()) / std_areas
+                            if std_areas > 0 else np.zeros_like(areas_display))
+        normalized_perimeters = ((perimeters_display - perimeters_display.mean()) / std_perimeters
+                                 if std_perimeters > 0 else np.zeros_like(perimeters_display))
+        
+        # 统计量在NumPy侧预计算后交给bxp绘制，
+        # 跳过boxplot内部对原始数据的逐序列遍历
+        box_stats = [
+            _box_stats(normalized_areas, 'Площадь\n(нормализованная)'),
+            _box_stats(normalized_perimeters, 'Периметр\n(нормализованный)'),
+        ]
+
         # 创建箱线图
-        bp = ax.boxplot(box_data, labels=box_labels, patch_artist=True, 
-                       notch=True, showmeans=True)
+        bp = ax.bxp(box_stats, patch_artist=True, showmeans=True)
         
         # 设置颜色
         colors = ['#ff6b6b', '#4ecdc4']
@@ -1387,9 +1623,9 @@ class StoneAnalysisDemo(QMainWindow):
         plt.setp(bp['means'], marker='D', markerfacecolor='white', 
                 markeredgecolor='#2c3e50', markersize=6)
         
-        ax.set_ylabel('Нормализованные значения', fontdict={'family': 'DejaVu Sans', 'size': 11})
+        ax.set_ylabel('Нормализованные значения', fontdict=_FONT_AX)
         ax.set_title('Диаграмма распределения характеристик',
-                    fontdict={'family': 'DejaVu Sans', 'size': 12, 'weight': 'bold'}, pad=12)
+                    fontdict=_FONT_TITLE, pad=12)
         
         ax.grid(True, alpha=0.3, linestyle='--')
         ax.set_facecolor('#fafbfc')
@@ -1397,74 +1633,65 @@ class StoneAnalysisDemo(QMainWindow):
         # 设置刻度标签字体
         ax.tick_params(axis='both', which='major', labelsize=9)
         
-        self.box_figure.tight_layout(pad=2.0)
-        self.box_canvas.draw()
+        self.box_canvas.draw_idle()
     
     def update_comparison_chart(self, contour_results):
         """更新对比分析图表"""
-        self.comparison_figure.clear()
-        
-        # 计算轮廓面积
-        contour_areas = [cv2.contourArea(cnt) for cnt in contour_results["all_contours"]]
-        if not contour_areas:
-            return
-        
-        # 根据标定比例转换单位
-        if self.scale_ratio > 1.0:
-            areas_display = [area / (self.scale_ratio ** 2) for area in contour_areas]
-            unit = 'mm²'
-        else:
-            areas_display = contour_areas
-            unit = 'px²'
-        
-        # 创建2x2子图布局，增加间距避免重叠
-        gs = self.comparison_figure.add_gridspec(2, 2, hspace=0.45, wspace=0.35, 
-                                                top=0.92, bottom=0.08, left=0.08, right=0.95)
-        
-        # 1. гистограмма распределения площадей
-        ax1 = self.comparison_figure.add_subplot(gs[0, 0])
-        n, bins, patches = ax1.hist(areas_display, bins=12, alpha=0.7, color='#3498db', edgecolor='white')
-        ax1.set_xlabel(f'Площадь ({unit})', fontsize=9, fontfamily='DejaVu Sans')
-        ax1.set_ylabel('Количество', fontsize=9, fontfamily='DejaVu Sans')
-        ax1.set_title('Распределение площадей', fontsize=10, weight='bold', fontfamily='DejaVu Sans', pad=8)
+        for ax in self.comparison_axes:
+            ax.clear()
+
+
+        # 面积数组在update_analysis_display中统一预计算（空结果已在上游短路）
+        areas_display = contour_results["_areas_disp"]
+        unit = contour_results["_area_unit"]
+
+        # 只排序一次，所有秩统计量（累积曲线/分位数/中位数/极值）都从这份数组导出
+        sorted_areas = np.sort(areas_display)
+        n_areas = len(sorted_areas)
+        mean_area = np.mean(sorted_areas)
+        std_area = np.std(sorted_areas)
+
+        # 2x2子图布局在_create_comparison_tab中已构建一次，这里直接复用
+        ax1, ax2, ax3, ax4 = self.comparison_axes
+
+        # 1. гистограмма распределения площадей（同样预分桶后用bar渲染）
+        hist_counts, hist_edges = np.histogram(sorted_areas, bins=12)
+        ax1.bar(0.5 * (hist_edges[:-1] + hist_edges[1:]), hist_counts,
+                width=np.diff(hist_edges), alpha=0.7, color='#3498db',
+                edgecolor='white', align='center')
+        ax1.set_xlabel(f'Площадь ({unit})', fontdict=_FONT_SM)
+        ax1.set_ylabel('Количество', fontdict=_FONT_SM)
+        ax1.set_title('Распределение площадей', fontdict=_FONT_SM_TITLE, pad=8)
         ax1.grid(True, alpha=0.3)
         ax1.tick_params(axis='both', which='major', labelsize=8)
         
         # 2. кумулятивное распределение
-        ax2 = self.comparison_figure.add_subplot(gs[0, 1])
-        sorted_areas = np.sort(areas_display)
-        cumulative = np.arange(1, len(sorted_areas) + 1) / len(sorted_areas) * 100
+        cumulative = np.arange(1, n_areas + 1) / n_areas * 100
         ax2.plot(sorted_areas, cumulative, color='#e74c3c', linewidth=2.5)
-        ax2.set_xlabel(f'Площадь ({unit})', fontsize=9, fontfamily='DejaVu Sans')
-        ax2.set_ylabel('Кумулятивный %', fontsize=9, fontfamily='DejaVu Sans')
-        ax2.set_title('Кумулятивное распределение', fontsize=10, weight='bold', fontfamily='DejaVu Sans', pad=8)
+        ax2.set_xlabel(f'Площадь ({unit})', fontdict=_FONT_SM)
+        ax2.set_ylabel('Кумулятивный %', fontdict=_FONT_SM)
+        ax2.set_title('Кумулятивное распределение', fontdict=_FONT_SM_TITLE, pad=8)
         ax2.grid(True, alpha=0.3)
         ax2.tick_params(axis='both', which='major', labelsize=8)
         
         # 3. статистика по категориям
-        ax3 = self.comparison_figure.add_subplot(gs[1, 0])
-        
         # классификация по площади
-        percentiles = [25, 50, 75, 90]
-        thresholds = [np.percentile(areas_display, p) for p in percentiles]
+        # 分位数直接按秩从已排序数组取值，不再触发额外的partition扫描
+        quantile_idx = np.minimum(
+            (np.array([0.25, 0.5, 0.75, 0.9]) * n_areas).astype(int), n_areas - 1)
+        thresholds = sorted_areas[quantile_idx]
         
         categories = ['0-25%', '25-50%', '50-75%', '75-90%', '90-100%']
-        counts = []
-        
-        for i in range(len(categories)):
-            if i == 0:
-                count = sum(1 for area in areas_display if area <= thresholds[0])
-            elif i == len(categories) - 1:
-                count = sum(1 for area in areas_display if area > thresholds[-1])
-            else:
-                count = sum(1 for area in areas_display if thresholds[i-1] < area <= thresholds[i])
-            counts.append(count)
-        
+
+        # 单次C级np.histogram分桶，替代5×N次Python级比较
+        bucket_edges = np.concatenate(([-np.inf], thresholds, [np.inf]))
+        counts, _ = np.histogram(areas_display, bins=bucket_edges)
+
         colors = ['#3498db', '#2ecc71', '#f39c12', '#e74c3c', '#9b59b6']
         bars = ax3.bar(categories, counts, color=colors, alpha=0.8)
-        ax3.set_xlabel('Процентильные группы', fontsize=9, fontfamily='DejaVu Sans')
-        ax3.set_ylabel('Количество', fontsize=9, fontfamily='DejaVu Sans')
-        ax3.set_title('Распределение по группам', fontsize=10, weight='bold', fontfamily='DejaVu Sans', pad=8)
+        ax3.set_xlabel('Процентильные группы', fontdict=_FONT_SM)
+        ax3.set_ylabel('Количество', fontdict=_FONT_SM)
+        ax3.set_title('Распределение по группам', fontdict=_FONT_SM_TITLE, pad=8)
         ax3.tick_params(axis='both', which='major', labelsize=8)
         
         # поворот меток оси x для избежания наложения
@@ -1477,27 +1704,26 @@ class StoneAnalysisDemo(QMainWindow):
                     f'{count}', ha='center', va='bottom', fontsize=8, fontweight='bold')
         
         # 4. статистическая сводка
-        ax4 = self.comparison_figure.add_subplot(gs[1, 1])
         ax4.axis('off')
         
         # расчет статистической информации, оптимизация формата текста
         stats_text = f"""📊 СТАТИСТИЧЕСКАЯ СВОДКА
 
-• Общее количество: {len(areas_display)}
-• Средняя площадь: {np.mean(areas_display):.1f} {unit}
-• Медианная площадь: {np.median(areas_display):.1f} {unit}
-• Стандартное отклонение: {np.std(areas_display):.1f} {unit}
-• Минимальная площадь: {np.min(areas_display):.1f} {unit}
-• Максимальная площадь: {np.max(areas_display):.1f} {unit}
-• Коэффициент вариации: {(np.std(areas_display)/np.mean(areas_display)*100):.1f}%"""
-        
-        ax4.text(0.05, 0.95, stats_text, transform=ax4.transAxes, fontsize=9,
-                verticalalignment='top', fontfamily='DejaVu Sans', linespacing=1.3,
+• Общее количество: {n_areas}
+• Средняя площадь: {mean_area:.1f} {unit}
+• Медианная площадь: {sorted_areas[n_areas // 2]:.1f} {unit}
+• Стандартное отклонение: {std_area:.1f} {unit}
+• Минимальная площадь: {sorted_areas[0]:.1f} {unit}
+• Максимальная площадь: {sorted_areas[-1]:.1f} {unit}
+• Коэффициент вариации: {(std_area / mean_area * 100):.1f}%"""
+        
+        ax4.text(0.05, 0.95, stats_text, transform=ax4.transAxes, fontdict=_FONT_SM,
+                verticalalignment='top', linespacing=1.3,
                 bbox=dict(boxstyle='round,pad=0.6', facecolor='#f8f9fa', 
                          edgecolor='#dee2e6', alpha=0.9, linewidth=1))
         
         # настройка положения и размера главного заголовка
-        self.comparison_figure.suptitle('Комплексный анализ фракций щебня', 
-                                       fontsize=12, weight='bold', y=1.08, fontfamily='DejaVu Sans')
+        self.comparison_figure.suptitle('Комплексный анализ фракций щебня',
+                                       y=1.08, **_FONT_TITLE)
         
-        self.comparison_canvas.draw()
\ No newline at end of file
+        self.comparison_canvas.draw_idle()
\ No newline at end of file
@@ -12,38 +12,167 @@
 
 import cv2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
+# 阈值支路与Canny支路并行执行用的双线程池（OpenCV调用内部释放GIL，线程可真正并行）
+_STAGE_POOL = ThreadPoolExecutor(max_workers=2)
 
-def perform_contour_analysis(image, canny_t1=50, canny_t2=200, min_area=50):
+# 详细轮廓数据的结构化数组布局（SoA），供CSV导出和图表直接按列读取；
+# 相比逐轮廓建dict，N个轮廓只需一次分配，np.savetxt可整列直写
+DETAILED_CONTOUR_DTYPE = np.dtype([('id', 'i4'), ('area', 'f8'), ('perimeter', 'f8')])
+
+# 模块加载时探测一次CUDA设备，避免每次分析重复查询
+try:
+    _HAS_CUDA = cv2.cuda.getCudaEnabledDeviceCount() > 0
+except (AttributeError, cv2.error):
+    _HAS_CUDA = False
+
+# 按(t1, t2)缓存GPU Canny检测器，避免逐次调用重新构造
+_CUDA_CANNY_DETECTORS = {}
+
+# 模块加载时探测一次OpenCL：T-API会把UMat上的逐像素操作
+# (cvtColor/threshold/GaussianBlur/Canny)路由到OpenCL设备或CPU SIMD
+try:
+    cv2.ocl.setUseOpenCL(True)
+    _HAS_OPENCL = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+except (AttributeError, cv2.error):
+    _HAS_OPENCL = False
+
+
+def _canny_edges(gray, t1, t2):
+    """
+    计算Canny边缘图
+
+    有CUDA设备时通过GPU执行Sobel+非极大值抑制阶段，
+    否则透明退回CPU实现。findContours没有CUDA等价物，始终在CPU上运行。
+
+    Args:
+        gray (numpy.ndarray): 灰度图像
+        t1 (int): Canny低阈值
+        t2 (int): Canny高阈值
+
+    Returns:
+        numpy.ndarray: 二值边缘图
+    """
+    if _HAS_CUDA:
+        detector = _CUDA_CANNY_DETECTORS.get((t1, t2))
+        if detector is None:
+            detector = cv2.cuda.createCannyEdgeDetector(t1, t2)
+            _CUDA_CANNY_DETECTORS[(t1, t2)] = detector
+        gmat = cv2.cuda_GpuMat()
+        gmat.upload(gray)
+        return detector.detect(gmat).download()
+    if _HAS_OPENCL:
+        return cv2.Canny(cv2.UMat(gray), t1, t2).get()
+    return cv2.Canny(gray, t1, t2)
+
+
+def _batch_area_perimeter(contours, need_perimeters=True):
+    """
+    在打包的SoA点缓冲区上批量计算鞋带面积与多边形周长
+
+    所有轮廓点拼接为一个(N,2)连续数组，相邻点对的叉积/线段长度
+    一次性向量化计算，再用np.add.reduceat按轮廓分段归约——
+    替代逐轮廓的contourArea/arcLength调用，消除N次Python↔C往返。
+
+    Args:
+        contours (list): 轮廓列表
+        need_perimeters (bool): 为False时跳过逐线段的sqrt遍历
+            （周长是此处唯一的FP重载循环），返回None代替周长数组
+
+    Returns:
+        tuple: (面积数组, 周长数组或None)，与轮廓列表同序
+    """
+    if len(contours) == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return (empty, empty if need_perimeters else None)
+
+    counts = np.fromiter(map(len, contours), dtype=np.intp, count=len(contours))
+    points = np.vstack([c.reshape(-1, 2) for c in contours]).astype(np.float64)
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    # 每个点的"下一点"索引：轮廓末点回绕到本轮廓首点（闭合多边形）
+    nxt = np.arange(1, len(points) + 1)
+    nxt[offsets[1:] - 1] = offsets[:-1]
+
+    px, py = points[:, 0], points[:, 1]
+    qx, qy = px[nxt], py[nxt]
+    cross = px * qy - qx * py
+    areas = np.abs(np.add.reduceat(cross, offsets[:-1])) * 0.5
+
+    if not need_perimeters:
+        return areas, None
+
+    seg_len = np.hypot(qx - px, qy - py)
+    perimeters = np.add.reduceat(seg_len, offsets[:-1])
+    return areas, perimeters
+
+
+def perform_contour_analysis(image, canny_t1=50, canny_t2=200, min_area=50, detailed=True,
+                             gray=None):
     """
     对输入图像执行轮廓分析
     参考main1.py的两阶段处理方法：
     1. 使用阈值处理找到所有轮廓
     2. 使用Canny边缘检测找到主要轮廓
-    
+
     Args:
         image: 输入的BGR图像
         canny_t1: Canny边缘检测的低阈值 (新增参数)
         canny_t2: Canny边缘检测的高阈值 (新增参数)
         min_area: 最小轮廓面积阈值 (新增参数)
-        
+        detailed: 是否生成完整排序的detailed_contours；只需汇总统计时
+            传False，用argpartition选top-5代替O(N log N)完整排序
+        gray: 可选的预计算灰度图；调用方已做过灰度转换（如经preprocess_image）
+            时传入，省去一次整幅cvtColor
+
     Returns:
         dict: 包含分析结果的字典，新增detailed_contours字段
     """
+    # 灰度转换与阈值化走UMat（可用时），findContours为CPU专用，调用前.get()回ndarray；
+    # 调用方已提供灰度图时整个转换步骤直接跳过
+    u_gray = None
+    if gray is None:
+        if _HAS_OPENCL:
+            u_gray = cv2.cvtColor(cv2.UMat(image), cv2.COLOR_BGR2GRAY)
+            gray = u_gray.get()
+        else:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
     # 第一阶段：使用阈值处理找到所有轮廓（参考main1.py第一部分）
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    _, threshold = cv2.threshold(gray, 127, 255, cv2.THRESH_BINARY)
-    
-    # 寻找所有轮廓
-    all_contours, _ = cv2.findContours(threshold, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
-    
+    def _threshold_branch():
+        if u_gray is not None:
+            threshold = cv2.threshold(u_gray, 127, 255, cv2.THRESH_BINARY)[1].get()
+        else:
+            _, threshold = cv2.threshold(gray, 127, 255, cv2.THRESH_BINARY)
+        all_contours, _ = cv2.findContours(threshold, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
+        return threshold, all_contours
+
     # 第二阶段：使用Canny边缘检测找到主要轮廓（参考main1.py第二部分）
-    edges = cv2.Canny(gray, canny_t1, canny_t2)
-    main_contours, _ = cv2.findContours(edges.copy(), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
-    
+    def _canny_branch():
+        edges = _canny_edges(gray, canny_t1, canny_t2)
+        # CHAIN_APPROX_SIMPLE只保留折线端点：下游的面积/周长/绘制都不需要逐像素分辨率，
+        # 轮廓点数组缩小一到两个数量级，后续所有遍历随之变快。
+        # OpenCV 4的findContours不修改输入，无需再防御性.copy()整幅边缘图
+        main_contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        return main_contours
+
+    # 两条支路相互独立：阈值支路提交线程池，Canny支路留在当前线程并行执行
+    threshold_future = _STAGE_POOL.submit(_threshold_branch)
+    main_contours = _canny_branch()
+    threshold, all_contours = threshold_future.result()
+
+
     # 过滤小轮廓 (使用传入的最小面积参数)
-    filtered_contours = [cnt for cnt in main_contours if cv2.contourArea(cnt) > min_area]
-    
+    # 面积与周长在打包缓冲区上一次批量算出，最小面积门限用布尔掩码完成；
+    # 汇总模式（detailed=False）跳过全量周长，只对选出的top-k补算
+    main_areas, main_perimeters = _batch_area_perimeter(main_contours, need_perimeters=detailed)
+    keep_idx = np.flatnonzero(main_areas > min_area)
+    filtered_contours = [main_contours[i] for i in keep_idx]
+    filtered_areas = main_areas[keep_idx]
+    filtered_perimeters = (main_perimeters[keep_idx] if detailed
+                           else np.empty(0, dtype=np.float64))
+
     if not filtered_contours:
         return {
             'contour_count': 0,
@@ -56,42 +185,58 @@ def perform_contour_analysis(image, canny_t1=50, canny_t2=200, min_area=50):
             'largest_contour': None,
             'second_largest_contour': None,
             'all_contours': [],
-            'detailed_contours': []  # 新增：详细轮廓数据
+            'areas': np.empty(0, dtype=np.float64),       # 新增：SoA面积数组
+            'perimeters': np.empty(0, dtype=np.float64),  # 新增：SoA周长数组
+            'binary_mask': threshold,  # 新增：阈值二值掩码（整体面积可直接countNonZero）
+            'detailed_contours': np.empty(0, dtype=DETAILED_CONTOUR_DTYPE)  # 新增：详细轮廓数据
         }
     
-    # 按面积排序轮廓（降序）
-    sorted_contours = sorted(filtered_contours, key=cv2.contourArea, reverse=True)
-    
+    # 按面积排序轮廓（降序，基于已缓存的面积数组）：
+    # 需要完整明细时做全量argsort；只取最大/第五大时argpartition选出
+    # top-5后仅对这5个元素排序，把O(N log N)降为O(N)
+    if detailed:
+        order = np.argsort(-filtered_areas)
+    else:
+        k = min(5, len(filtered_areas))
+        top_idx = np.argpartition(-filtered_areas, k - 1)[:k]
+        order = top_idx[np.argsort(-filtered_areas[top_idx])]
+    sorted_contours = [filtered_contours[i] for i in order]
+    sorted_areas = filtered_areas[order]
+    if detailed:
+        sorted_perimeters = filtered_perimeters[order]
+    else:
+        # 只为选出的top-k（≤5个轮廓）补算周长
+        _, sorted_perimeters = _batch_area_perimeter(sorted_contours)
+
     # 获取最大和第五大轮廓（参考main1.py的实现）
     largest_contour = sorted_contours[0]
     # 如果有足够的轮廓，取第五大的；否则取第二大的
     if len(sorted_contours) >= 5:
-        second_largest_contour = sorted_contours[4]  # 第五大轮廓
+        second_largest_idx = 4  # 第五大轮廓
     elif len(sorted_contours) > 1:
-        second_largest_contour = sorted_contours[1]  # 第二大轮廓
+        second_largest_idx = 1  # 第二大轮廓
     else:
-        second_largest_contour = None
-    
-    # 计算统计数据
-    largest_area = cv2.contourArea(largest_contour)
-    largest_perimeter = cv2.arcLength(largest_contour, True)
-    
-    second_largest_area = cv2.contourArea(second_largest_contour) if second_largest_contour is not None else 0
-    second_largest_perimeter = cv2.arcLength(second_largest_contour, True) if second_largest_contour is not None else 0
-    
-    total_area = sum(cv2.contourArea(cnt) for cnt in filtered_contours)
+        second_largest_idx = None
+    second_largest_contour = sorted_contours[second_largest_idx] if second_largest_idx is not None else None
+
+    # 计算统计数据（全部复用已缓存的数组，不再重复调用contourArea/arcLength）
+    largest_area = float(sorted_areas[0])
+    largest_perimeter = float(sorted_perimeters[0])
+
+    second_largest_area = float(sorted_areas[second_largest_idx]) if second_largest_idx is not None else 0
+    second_largest_perimeter = float(sorted_perimeters[second_largest_idx]) if second_largest_idx is not None else 0
+
+    total_area = float(filtered_areas.sum())
     area_ratio = (largest_area / total_area * 100) if total_area > 0 else 0
-    
-    # 新增：生成详细轮廓数据用于CSV导出
-    detailed_contours = []
-    for i, contour in enumerate(sorted_contours):
-        area = cv2.contourArea(contour)
-        perimeter = cv2.arcLength(contour, True)
-        detailed_contours.append({
-            'id': i + 1,
-            'area': area,
-            'perimeter': perimeter
-        })
+
+    # 新增：生成详细轮廓数据用于CSV导出（结构化数组按列存储，避免逐轮廓建字典）
+    if detailed:
+        detailed_contours = np.empty(len(sorted_contours), dtype=DETAILED_CONTOUR_DTYPE)
+        detailed_contours['id'] = np.arange(1, len(sorted_contours) + 1)
+        detailed_contours['area'] = sorted_areas
+        detailed_contours['perimeter'] = sorted_perimeters
+    else:
+        detailed_contours = np.empty(0, dtype=DETAILED_CONTOUR_DTYPE)
     
     return {
         'contour_count': len(filtered_contours),
@@ -104,10 +249,27 @@ def perform_contour_analysis(image, canny_t1=50, canny_t2=200, min_area=50):
         'largest_contour': largest_contour,
         'second_largest_contour': second_largest_contour,
         'all_contours': filtered_contours,
+        'areas': filtered_areas,            # 新增：与all_contours同序的面积数组
+        'perimeters': filtered_perimeters,  # 新增：与all_contours同序的周长数组
+        'binary_mask': threshold,           # 新增：阈值二值掩码（整体面积可直接countNonZero）
         'detailed_contours': detailed_contours  # 新增：详细轮廓数据
     }
 
 
+# create_contour_result_image的整幅结果缓冲池：形状不变时跨帧复用，
+# 实时预览下省去每次调用一整块HxWx3的分配器往返
+_RESULT_BUF = None
+
+
+def _get_result_buf(img):
+    """返回与img同形状的池化缓冲区并拷入其内容（仅形状变化时重新分配）"""
+    global _RESULT_BUF
+    if _RESULT_BUF is None or _RESULT_BUF.shape != img.shape or _RESULT_BUF.dtype != img.dtype:
+        _RESULT_BUF = np.empty_like(img)
+    np.copyto(_RESULT_BUF, img)
+    return _RESULT_BUF
+
+
 def create_contour_result_image(img, contour_results):
     """
     创建专用轮廓结果图像
@@ -123,15 +285,15 @@ def create_contour_result_image(img, contour_results):
     Returns:
         numpy.ndarray: 带有轮廓标记的结果图像 (BGR格式)
     """
-    # 创建原始图像的副本
-    result_img = img.copy()
+    # 把原始图像拷入池化缓冲区（复用分配，内容每次重写，调用方不应长期持有返回值）
+    result_img = _get_result_buf(img)
     
     # 第一步：绘制所有轮廓（红色细线，参考main1.py第一部分）
+    # 整个列表一次传入（索引-1表示全部），在OpenCV C++内部单次迭代完成绘制；
+    # 仍跳过第一个轮廓（通常是整个图像边界）
     all_contours = contour_results["all_contours"]
-    for i, contour in enumerate(all_contours):
-        if i == 0:  # 跳过第一个轮廓（通常是整个图像边界）
-            continue
-        cv2.drawContours(result_img, [contour], 0, (0, 0, 255), 2)
+    if len(all_contours) > 1:
+        cv2.drawContours(result_img, all_contours[1:], -1, (0, 0, 255), 2)
     
     # 第二步：突出显示最大面积轮廓（红色粗线）
     largest_contour = contour_results["largest_contour"]
@@ -159,21 +321,32 @@ def analyze_contour_properties(contour):
     if contour is None:
         return None
         
-    # 计算基本属性
-    area = cv2.contourArea(contour)
-    perimeter = cv2.arcLength(contour, True)
-    
-    # 计算质心
-    M = cv2.moments(contour)
-    if M['m00'] != 0:
-        cx = int(M['m10'] / M['m00'])
-        cy = int(M['m01'] / M['m00'])
+    # 面积/周长/质心/边界矩形全部从同一份L1驻留的pts缓冲区融合计算：
+    # 鞋带公式求面积、相邻点距求闭合周长，替代contourArea/arcLength/moments/
+    # boundingRect四次独立的Python↔C往返
+    pts = contour.reshape(-1, 2).astype(np.float64)
+    x_arr, y_arr = pts[:, 0], pts[:, 1]
+    x_next, y_next = np.roll(x_arr, -1), np.roll(y_arr, -1)
+    cross = x_arr * y_next - x_next * y_arr
+
+    signed_area = cross.sum() * 0.5
+    area = float(abs(signed_area))
+    perimeter = float(np.hypot(x_next - x_arr, y_next - y_arr).sum())
+
+    # 计算质心：多边形形心公式复用已有的cross数组（与moments的m10/m01/m00等价，
+    # 但不计算其余21个用不到的矩）；退化轮廓（零面积）退回顶点均值
+    if signed_area != 0:
+        cx = int(((x_arr + x_next) * cross).sum() / (6.0 * signed_area))
+        cy = int(((y_arr + y_next) * cross).sum() / (6.0 * signed_area))
     else:
-        cx, cy = 0, 0
-    
+        cx, cy = (int(v) for v in pts.mean(axis=0))
+
     # 计算边界矩形
-    x, y, w, h = cv2.boundingRect(contour)
-    
+    x_min, y_min = pts.min(axis=0)
+    x_max, y_max = pts.max(axis=0)
+    x, y = int(x_min), int(y_min)
+    w, h = int(x_max - x_min + 1), int(y_max - y_min + 1)
+
     # 计算最小外接圆
     (circle_x, circle_y), radius = cv2.minEnclosingCircle(contour)
     
@@ -204,61 +377,127 @@ def analyze_contour_properties(contour):
     }
 
 
-def filter_contours_by_area(contours, min_area=50, max_area=None):
+def contour_areas_array(contours):
+    """
+    批量计算轮廓面积数组
+
+    Args:
+        contours (list): 轮廓列表
+
+    Returns:
+        numpy.ndarray: 与轮廓列表同序的面积数组 (float64)
+    """
+    return np.fromiter(map(cv2.contourArea, contours),
+                       dtype=np.float64, count=len(contours))
+
+
+def _filter_sort_stats(areas, min_area, max_count=None):
+    """
+    过滤+排序+统计的融合单遍计算
+
+    代替"过滤→排序→统计"三次独立遍历：一次掩码过滤、一次argsort，
+    统计量直接从降序数组按秩读取（最大/最小/中位数零额外扫描）。
+
+    Args:
+        areas (numpy.ndarray): 与原轮廓列表同序的面积数组
+        min_area (float): 最小面积阈值
+        max_count (int): 保留的最大轮廓数量 (None表示无限制)
+
+    Returns:
+        tuple: (降序排列的原始索引数组, 统计信息字典)
+    """
+    keep_idx = np.flatnonzero(areas >= min_area)
+    order = np.argsort(-areas[keep_idx])
+    sorted_idx = keep_idx[order]
+    if max_count is not None:
+        sorted_idx = sorted_idx[:max_count]
+
+    sorted_areas = areas[sorted_idx]
+    n = len(sorted_areas)
+    if n == 0:
+        stats = {
+            "count": 0,
+            "total_area": 0,
+            "mean_area": 0,
+            "std_area": 0,
+            "min_area": 0,
+            "max_area": 0,
+            "median_area": 0
+        }
+        return sorted_idx, stats
+
+    total_area = float(sorted_areas.sum())
+    # 数组已降序：最大在首位，最小在末位，中位数按秩取值
+    median_area = (float(sorted_areas[n // 2]) if n % 2
+                   else float(sorted_areas[n // 2 - 1] + sorted_areas[n // 2]) / 2)
+    stats = {
+        "count": n,
+        "total_area": total_area,
+        "mean_area": total_area / n,
+        "std_area": float(sorted_areas.std()),
+        "min_area": float(sorted_areas[-1]),
+        "max_area": float(sorted_areas[0]),
+        "median_area": median_area
+    }
+    return sorted_idx, stats
+
+
+def filter_contours_by_area(contours, min_area=50, max_area=None, areas=None):
     """
     根据面积过滤轮廓
-    
+
     Args:
         contours (list): 轮廓列表
         min_area (float): 最小面积阈值
         max_area (float): 最大面积阈值 (None表示无限制)
-        
+        areas (numpy.ndarray): 可选的预计算面积数组，避免重复调用contourArea
+
     Returns:
         list: 过滤后的轮廓列表
     """
-    filtered_contours = []
-    
-    for contour in contours:
-        area = cv2.contourArea(contour)
-        
-        # 检查最小面积
-        if area < min_area:
-            continue
-            
-        # 检查最大面积
-        if max_area is not None and area > max_area:
-            continue
-            
-        filtered_contours.append(contour)
-    
-    return filtered_contours
+    if areas is None:
+        areas = contour_areas_array(contours)
+
+    # 面积门限整体在C级布尔掩码里比较，循环中不再有逐轮廓的Python级分支
+    mask = areas >= min_area
+    if max_area is not None:
+        mask &= areas <= max_area
 
+    return [contour for contour, keep in zip(contours, mask) if keep]
 
-def sort_contours_by_area(contours, reverse=True):
+
+def sort_contours_by_area(contours, reverse=True, areas=None):
     """
     按面积对轮廓进行排序
-    
+
     Args:
         contours (list): 轮廓列表
         reverse (bool): 是否降序排列 (True为降序，False为升序)
-        
+        areas (numpy.ndarray): 可选的预计算面积数组，避免排序键重复调用contourArea
+
     Returns:
         list: 排序后的轮廓列表
     """
-    return sorted(contours, key=cv2.contourArea, reverse=reverse)
+    # argsort在连续float64数组上做C级排序；排序键回调的O(N log N)次
+    # contourArea调用降为批量计算的O(N)次
+    if areas is None:
+        areas = contour_areas_array(contours)
+    order = np.argsort(-areas if reverse else areas)
+    return [contours[i] for i in order]
 
 
-def get_contour_statistics(contours):
+def get_contour_statistics(contours, areas=None):
     """
     计算轮廓集合的统计信息
-    
+
     Args:
         contours (list): 轮廓列表
-        
+        areas (numpy.ndarray): 可选的预计算面积数组，避免重复调用contourArea
+
     Returns:
         dict: 统计信息字典
     """
-    if not contours:
+    if len(contours) == 0:
         return {
             "count": 0,
             "total_area": 0,
@@ -268,18 +507,28 @@ def get_contour_statistics(contours):
             "max_area": 0,
             "median_area": 0
         }
-    
-    # 计算所有面积
-    areas = [cv2.contourArea(contour) for contour in contours]
-    
+
+    # 计算所有面积（调用方已有缓存时直接复用）
+    if areas is None:
+        areas = contour_areas_array(contours)
+
+    # 一次partition同时定位最小值/最大值/中位数，替代min/max/median三次独立扫描；
+    # 方差走sum/sumsq恒等式：平方和用np.dot融合乘加，不再为(x-mean)²建临时数组
+    n = len(areas)
+    total_area = float(areas.sum())
+    mean_area = total_area / n
+    sum_sq = float(np.dot(areas, areas))
+    kth = [0, (n - 1) // 2, n // 2, n - 1]
+    part = np.partition(areas, kth)
+
     return {
-        "count": len(contours),
-        "total_area": sum(areas),
-        "mean_area": np.mean(areas),
-        "std_area": np.std(areas),
-        "min_area": min(areas),
-        "max_area": max(areas),
-        "median_area": np.median(areas)
+        "count": n,
+        "total_area": total_area,
+        "mean_area": mean_area,
+        "std_area": float(np.sqrt(max(sum_sq / n - mean_area * mean_area, 0.0))),
+        "min_area": float(part[0]),
+        "max_area": float(part[-1]),
+        "median_area": float(part[(n - 1) // 2] + part[n // 2]) / 2
     }
 
 
@@ -296,15 +545,21 @@ def preprocess_image(img, blur_kernel_size=5, canny_low=50, canny_high=200):
     Returns:
         tuple: (灰度图, 边缘图)
     """
+    # 整条滤波链（灰度→模糊→Canny）走UMat（可用时），数据留在设备侧，
+    # 仅在返回前.get()回ndarray供findContours等CPU调用使用
+    src = cv2.UMat(img) if _HAS_OPENCL else img
+
     # 转换为灰度图
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-    
-    # 高斯模糊去噪
-    blurred = cv2.GaussianBlur(gray, (blur_kernel_size, blur_kernel_size), 0)
-    
-    # Canny边缘检测
-    edges = cv2.Canny(blurred, canny_low, canny_high)
-    
+    gray = cv2.cvtColor(src, cv2.COLOR_BGR2GRAY)
+
+    # 高斯模糊去噪（原地写回灰度缓冲，省掉一整幅HxW中间图的读写）
+    cv2.GaussianBlur(gray, (blur_kernel_size, blur_kernel_size), 0, dst=gray)
+
+    # Canny边缘检测（L2梯度：更精确的幅值计算，代价可忽略）
+    edges = cv2.Canny(gray, canny_low, canny_high, L2gradient=True)
+
+    if _HAS_OPENCL:
+        return gray.get(), edges.get()
     return gray, edges
 
 
@@ -324,20 +579,12 @@ def detect_and_analyze_contours(img, min_area=50, max_contours=None):
     gray, edges = preprocess_image(img)
     
     # 查找轮廓
-    contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
-    
-    # 过滤轮廓
-    valid_contours = filter_contours_by_area(contours, min_area)
-    
-    # 排序轮廓
-    sorted_contours = sort_contours_by_area(valid_contours)
-    
-    # 限制轮廓数量
-    if max_contours is not None:
-        sorted_contours = sorted_contours[:max_contours]
-    
-    # 计算统计信息
-    stats = get_contour_statistics(sorted_contours)
+    contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+    # 面积只批量计算一次，过滤/排序/统计融合为单次数组遍历
+    areas = contour_areas_array(contours)
+    sorted_idx, stats = _filter_sort_stats(areas, min_area, max_contours)
+    sorted_contours = [contours[i] for i in sorted_idx]
     
     # 分析前两个最大轮廓
     largest_contour = sorted_contours[0] if len(sorted_contours) > 0 else None
@@ -13,20 +13,30 @@
 
 import sys
 import os
+import time
 import cv2
 import numpy as np
 import threading
 import queue
 import json
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field, fields
 from typing import List, Dict, Optional, Tuple, Callable
 from datetime import datetime
 
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
+
+# orjson可用时序列化走其C级快路径（contour_areas含大量浮点数），
+# 未安装则回退标准库json
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
@@ -57,6 +67,13 @@ class AnalysisConfig:
         if self.blue_hsv_ranges is None:
             self.blue_hsv_ranges = [((90, 30, 30), (140, 255, 255))]
 
+        # 上下界预转为uint8数组供cv2.inRange零转换直接使用；
+        # 存为普通属性而非dataclass字段，序列化时仍是原始元组
+        self._red_ranges_np = [(np.asarray(l, np.uint8), np.asarray(u, np.uint8))
+                               for l, u in self.red_hsv_ranges]
+        self._blue_ranges_np = [(np.asarray(l, np.uint8), np.asarray(u, np.uint8))
+                                for l, u in self.blue_hsv_ranges]
+
 
 @dataclass
 class AnalysisResult:
@@ -68,11 +85,16 @@ class AnalysisResult:
     largest_perimeter: float
     total_area: float
     area_ratio: float
-    contour_areas: List[float]
-    algorithm_used: str
-    processing_time: float
+    # 原始面积列表仅在内存中使用，不落盘（见contour_area_hist）
+    contour_areas: List[float] = field(metadata={'serialize': False})
+    algorithm_used: str = "unknown"
+    processing_time: float = 0.0
     image_path: Optional[str] = None
 
+    # 面积分布的16桶直方图——持久化用的紧凑摘要，
+    # 代替可能数百个浮点数的contour_areas
+    contour_area_hist: List[int] = field(default_factory=list)
+
     # 维修评估结果
     crushing_efficiency: float = 0.0
     equipment_status: str = "unknown"
@@ -95,12 +117,22 @@ class AlgorithmEngine:
         else:
             gray = image.copy()
 
-        # 高斯模糊
-        blurred = cv2.GaussianBlur(gray, (self.config.gaussian_blur_kernel, self.config.gaussian_blur_kernel), 0)
-        return blurred
-
-    def analyze(self, image: np.ndarray) -> Dict:
-        """抽象分析方法"""
+        # 高斯模糊写入持久缓冲区，逐帧复用避免重复分配
+        blur_buf = getattr(self, '_blur_buf', None)
+        if blur_buf is None or blur_buf.shape != gray.shape:
+            blur_buf = np.empty_like(gray)
+            self._blur_buf = blur_buf
+        k = self.config.gaussian_blur_kernel
+        cv2.GaussianBlur(gray, (k, k), 0, dst=blur_buf)
+        return blur_buf
+
+    def analyze(self, image: np.ndarray, *, blurred: np.ndarray = None,
+                hsv: np.ndarray = None) -> Dict:
+        """抽象分析方法
+
+        blurred/hsv可由上层（如混合算法）预先计算一次传入，
+        避免各子算法重复做cvtColor和高斯模糊
+        """
         raise NotImplementedError
 
     def postprocess(self, contours: List, image_shape: Tuple) -> List:
@@ -111,20 +143,44 @@ class AlgorithmEngine:
 class EdgeDetectionAlgorithm(AlgorithmEngine):
     """边缘检测算法"""
 
-    def analyze(self, image: np.ndarray) -> Dict:
-        processed = self.preprocess(image)
-
-        # Canny边缘检测
-        edges = cv2.Canny(processed, self.config.canny_lower_threshold, self.config.canny_upper_threshold)
-
-        # 形态学操作
-        kernel = np.ones((self.config.morphology_kernel_size, self.config.morphology_kernel_size), np.uint8)
-        edges = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, kernel)
-        edges = cv2.morphologyEx(edges, cv2.MORPH_OPEN, kernel)
-
-        # 查找轮廓
-        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        filtered_contours = self.postprocess(contours, image.shape)
+    def __init__(self, config: AnalysisConfig):
+        super().__init__(config)
+        # 结构元素只构造一次，不再每帧np.ones重新分配
+        k = config.morphology_kernel_size
+        self._morph_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (k, k))
+        self._dx = None
+        self._dy = None
+
+    def analyze(self, image: np.ndarray, *, blurred: np.ndarray = None,
+                hsv: np.ndarray = None) -> Dict:
+        processed = blurred if blurred is not None else self.preprocess(image)
+
+        # 共享一次Sobel梯度传给Canny，省去其内部重复的梯度计算；
+        # dx/dy缓冲区跨帧复用
+        if self._dx is None or self._dx.shape != processed.shape:
+            self._dx = np.empty(processed.shape, np.int16)
+            self._dy = np.empty(processed.shape, np.int16)
+        cv2.Sobel(processed, cv2.CV_16S, 1, 0, dst=self._dx)
+        cv2.Sobel(processed, cv2.CV_16S, 0, 1, dst=self._dy)
+        edges = cv2.Canny(self._dx, self._dy,
+                          self.config.canny_lower_threshold, self.config.canny_upper_threshold,
+                          L2gradient=False)
+
+        # 闭运算原地写回edges，代替原先close+open两遍全图扫描
+        cv2.morphologyEx(edges, cv2.MORPH_CLOSE, self._morph_kernel, dst=edges)
+
+        # 连通域统计一次C级遍历给出每个斑块的面积与包围盒，
+        # 小斑块在数组层面直接筛掉；轮廓只对留下的斑块在其ROI内提取，
+        # 代价是O(斑块)而非O(整图)，替代整图findContours+逐轮廓Python过滤
+        _, labels, stats, _ = cv2.connectedComponentsWithStats(edges, connectivity=8)
+        big_labels = np.flatnonzero(
+            stats[1:, cv2.CC_STAT_AREA] > self.config.min_contour_area) + 1
+
+        filtered_contours = []
+        for label_idx in big_labels:
+            contour = self._component_contour(labels, stats, int(label_idx))
+            if contour is not None:
+                filtered_contours.append(contour)
 
         return {
             'contours': filtered_contours,
@@ -132,6 +188,22 @@ class EdgeDetectionAlgorithm(AlgorithmEngine):
             'confidence': self._calculate_confidence(filtered_contours)
         }
 
+    @staticmethod
+    def _component_contour(labels: np.ndarray, stats: np.ndarray,
+                           label_idx: int) -> Optional[np.ndarray]:
+        """在连通域的包围盒ROI内提取其外轮廓（坐标已偏移回全图）"""
+        x = stats[label_idx, cv2.CC_STAT_LEFT]
+        y = stats[label_idx, cv2.CC_STAT_TOP]
+        w = stats[label_idx, cv2.CC_STAT_WIDTH]
+        h = stats[label_idx, cv2.CC_STAT_HEIGHT]
+
+        mask = (labels[y:y + h, x:x + w] == label_idx).astype(np.uint8)
+        found, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL,
+                                    cv2.CHAIN_APPROX_SIMPLE, offset=(x, y))
+        if not found:
+            return None
+        return max(found, key=cv2.contourArea) if len(found) > 1 else found[0]
+
     def _calculate_confidence(self, contours: List) -> float:
         """计算算法置信度"""
         if not contours:
@@ -142,26 +214,34 @@ class EdgeDetectionAlgorithm(AlgorithmEngine):
 class ColorSegmentationAlgorithm(AlgorithmEngine):
     """颜色分割算法"""
 
-    def analyze(self, image: np.ndarray) -> Dict:
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-
-        # 创建颜色掩码
-        combined_mask = np.zeros(hsv.shape[:2], dtype=np.uint8)
-
-        # 红色掩码
-        for lower, upper in self.config.red_hsv_ranges:
-            mask = cv2.inRange(hsv, np.array(lower), np.array(upper))
-            combined_mask = cv2.bitwise_or(combined_mask, mask)
-
-        # 蓝色掩码
-        for lower, upper in self.config.blue_hsv_ranges:
-            mask = cv2.inRange(hsv, np.array(lower), np.array(upper))
-            combined_mask = cv2.bitwise_or(combined_mask, mask)
-
-        # 形态学操作
-        kernel = np.ones((5, 5), np.uint8)
-        combined_mask = cv2.morphologyEx(combined_mask, cv2.MORPH_CLOSE, kernel)
-        combined_mask = cv2.morphologyEx(combined_mask, cv2.MORPH_OPEN, kernel)
+    def __init__(self, config: AnalysisConfig):
+        super().__init__(config)
+        # HSV上下界直接取配置里预转好的uint8数组，结构元素只构造一次
+        self._hsv_ranges = config._red_ranges_np + config._blue_ranges_np
+        self._morph_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+        self._mask_buf = None
+        self._tmp_buf = None
+
+    def analyze(self, image: np.ndarray, *, blurred: np.ndarray = None,
+                hsv: np.ndarray = None) -> Dict:
+        if hsv is None:
+            hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+
+        # 掩码与临时缓冲区跨帧复用，逐范围inRange/bitwise_or原地累积，
+        # 不再每个颜色范围分配一张新掩码
+        if self._mask_buf is None or self._mask_buf.shape != hsv.shape[:2]:
+            self._mask_buf = np.empty(hsv.shape[:2], dtype=np.uint8)
+            self._tmp_buf = np.empty(hsv.shape[:2], dtype=np.uint8)
+        combined_mask = self._mask_buf
+        combined_mask[:] = 0
+
+        for lower, upper in self._hsv_ranges:
+            cv2.inRange(hsv, lower, upper, dst=self._tmp_buf)
+            cv2.bitwise_or(combined_mask, self._tmp_buf, dst=combined_mask)
+
+        # 形态学操作（原地写回）
+        cv2.morphologyEx(combined_mask, cv2.MORPH_CLOSE, self._morph_kernel, dst=combined_mask)
+        cv2.morphologyEx(combined_mask, cv2.MORPH_OPEN, self._morph_kernel, dst=combined_mask)
 
         # 查找轮廓
         contours, _ = cv2.findContours(combined_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -188,15 +268,27 @@ class ColorSegmentationAlgorithm(AlgorithmEngine):
 class HybridAlgorithm(AlgorithmEngine):
     """混合算法 - 结合多种方法"""
 
+    # 两条子流水线相互独立，OpenCV内核释放GIL，
+    # 类级线程池让多核主机上混合模式接近单条流水线的耗时
+    _pool = ThreadPoolExecutor(max_workers=2)
+
     def __init__(self, config: AnalysisConfig):
         super().__init__(config)
         self.edge_algo = EdgeDetectionAlgorithm(config)
         self.color_algo = ColorSegmentationAlgorithm(config)
 
-    def analyze(self, image: np.ndarray) -> Dict:
-        # 同时运行两种算法
-        edge_result = self.edge_algo.analyze(image)
-        color_result = self.color_algo.analyze(image)
+    def analyze(self, image: np.ndarray, *, blurred: np.ndarray = None,
+                hsv: np.ndarray = None) -> Dict:
+        # 灰度模糊与HSV转换各做一次，分发给两条子流水线共享
+        if blurred is None:
+            blurred = self.edge_algo.preprocess(image)
+        if hsv is None:
+            hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+
+        # 边缘检测提交到线程池，颜色分割在当前线程执行，二者并行
+        edge_future = self._pool.submit(self.edge_algo.analyze, image, blurred=blurred)
+        color_result = self.color_algo.analyze(image, hsv=hsv)
+        edge_result = edge_future.result()
 
         # 根据置信度选择最佳结果
         if color_result['confidence'] > edge_result['confidence']:
@@ -216,46 +308,60 @@ class HybridAlgorithm(AlgorithmEngine):
         primary_result['algorithm'] = 'hybrid'
         return primary_result
 
+    # 重复判定阈值：质心距离（像素）与相对面积差
+    _DUP_RADIUS = 20
+    _DUP_AREA_THRESHOLD = 0.1
+
     def _remove_duplicate_contours(self, contours: List) -> List:
-        """移除重复轮廓"""
+        """移除重复轮廓
+
+        面积与质心每个轮廓只算一次，质心按_DUP_RADIUS大小的网格做
+        空间哈希，只与3×3邻域格内已接受的轮廓比较——整体O(N)，
+        替代原先逐对moments/contourArea重算的O(N²)扫描
+        """
         if not contours:
             return contours
 
-        unique_contours = []
-        for contour in contours:
-            is_duplicate = False
-            for existing in unique_contours:
-                # 简单的重复检测 - 比较轮廓中心和面积
-                if self._contours_similar(contour, existing):
-                    is_duplicate = True
+        n = len(contours)
+        areas = np.fromiter((cv2.contourArea(c) for c in contours), np.float64, count=n)
+        centroids = np.empty((n, 2), np.float64)
+        for i, c in enumerate(contours):
+            m = cv2.moments(c)
+            if m["m00"] != 0:
+                centroids[i] = (m["m10"] / m["m00"], m["m01"] / m["m00"])
+            else:
+                # 退化轮廓：用顶点均值近似质心
+                pts = c.reshape(-1, 2)
+                centroids[i] = pts.mean(axis=0)
+
+        cell = float(self._DUP_RADIUS)
+        bins = np.floor(centroids / cell).astype(np.int64)
+        grid = {}  # (bx, by) -> 已接受轮廓的索引列表
+        keep = np.zeros(n, dtype=np.bool_)
+
+        # 面积降序处理，重复组内保留最大的那个
+        for i in np.argsort(-areas):
+            bx, by = bins[i]
+            duplicate = False
+            for gx in (bx - 1, bx, bx + 1):
+                for gy in (by - 1, by, by + 1):
+                    for j in grid.get((gx, gy), ()):
+                        if abs(areas[i] - areas[j]) / max(areas[i], areas[j], 1.0) > self._DUP_AREA_THRESHOLD:
+                            continue
+                        dx = centroids[i, 0] - centroids[j, 0]
+                        dy = centroids[i, 1] - centroids[j, 1]
+                        if dx * dx + dy * dy < cell * cell:
+                            duplicate = True
+                            break
+                    if duplicate:
+                        break
+                if duplicate:
                     break
-            if not is_duplicate:
-                unique_contours.append(contour)
+            if not duplicate:
+                keep[i] = True
+                grid.setdefault((bx, by), []).append(i)
 
-        return unique_contours
-
-    def _contours_similar(self, c1, c2, threshold: float = 0.1) -> bool:
-        """检查两个轮廓是否相似"""
-        try:
-            # 比较面积
-            area1, area2 = cv2.contourArea(c1), cv2.contourArea(c2)
-            if abs(area1 - area2) / max(area1, area2, 1) > threshold:
-                return False
-
-            # 比较中心点
-            M1 = cv2.moments(c1)
-            M2 = cv2.moments(c2)
-            if M1["m00"] == 0 or M2["m00"] == 0:
-                return False
-
-            cx1, cy1 = int(M1["m10"] / M1["m00"]), int(M1["m01"] / M1["m00"])
-            cx2, cy2 = int(M2["m10"] / M2["m00"]), int(M2["m01"] / M2["m00"])
-
-            distance = np.sqrt((cx1 - cx2) ** 2 + (cy1 - cy2) ** 2)
-            return distance < 20  # 像素距离阈值
-
-        except:
-            return False
+        return [contours[i] for i in range(n) if keep[i]]
 
 
 # ===================== 核心分析服务 =====================
@@ -274,7 +380,9 @@ class ContourAnalysisService:
 
     def analyze_image(self, image: np.ndarray, algorithm: str = None) -> AnalysisResult:
         """执行图像分析"""
-        start_time = datetime.now()
+        # 计时用单调的perf_counter_ns，比datetime.now()轻得多；
+        # 挂钟时间戳只在生成结果时取一次
+        start_ns = time.perf_counter_ns()
 
         if algorithm is None:
             algorithm = self.config.primary_algorithm
@@ -292,7 +400,7 @@ class ContourAnalysisService:
             contours = result['contours']
 
             # 计算统计数据
-            analysis_result = self._calculate_statistics(contours, algorithm, start_time)
+            analysis_result = self._calculate_statistics(contours, algorithm, start_ns)
 
             # 维修评估
             analysis_result = self._assess_maintenance(analysis_result)
@@ -312,20 +420,21 @@ class ContourAnalysisService:
                 area_ratio=0,
                 contour_areas=[],
                 algorithm_used=algorithm,
-                processing_time=(datetime.now() - start_time).total_seconds()
+                processing_time=(time.perf_counter_ns() - start_ns) * 1e-9
             )
 
     def _select_best_algorithm(self, image: np.ndarray) -> str:
         """自动选择最佳算法"""
-        # 简单的图像特征分析
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-
-        # 检查颜色饱和度
-        saturation = hsv[:, :, 1]
-        avg_saturation = np.mean(saturation)
+        # 选择判定对分辨率不敏感，在128×128缩略图上统计即可，
+        # 大图下省去全分辨率的HSV转换与遍历
+        thumb = cv2.resize(image, (128, 128), interpolation=cv2.INTER_AREA)
+        hsv = cv2.cvtColor(thumb, cv2.COLOR_BGR2HSV)
 
-        # 检查颜色分布
-        color_variance = np.var(hsv[:, :, 0])
+        # 饱和度均值与色相方差由meanStdDev一次C级遍历同时得出，
+        # 替代np.mean/np.var对两个平面的四次扫描
+        means, stds = cv2.meanStdDev(hsv)
+        avg_saturation = float(means[1])
+        color_variance = float(stds[0]) ** 2
 
         if avg_saturation > 50 and color_variance > 200:
             return 'color_segmentation'
@@ -334,9 +443,9 @@ class ContourAnalysisService:
         else:
             return 'hybrid'
 
-    def _calculate_statistics(self, contours: List, algorithm: str, start_time: datetime) -> AnalysisResult:
+    def _calculate_statistics(self, contours: List, algorithm: str, start_ns: int) -> AnalysisResult:
         """计算统计数据"""
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = (time.perf_counter_ns() - start_ns) * 1e-9
 
         if not contours:
             return AnalysisResult(
@@ -352,17 +461,18 @@ class ContourAnalysisService:
                 processing_time=processing_time
             )
 
-        # 按面积排序
-        sorted_contours = sorted(contours, key=cv2.contourArea, reverse=True)
+        # 面积只算一遍进NumPy数组；前二名用argpartition选出，免去全排序
+        areas = np.fromiter((cv2.contourArea(c) for c in contours), np.float64, count=len(contours))
+        k = min(2, len(areas))
+        top_idx = np.argpartition(-areas, k - 1)[:k]
+        top_idx = top_idx[np.argsort(-areas[top_idx])]
 
-        # 计算面积
-        contour_areas = [cv2.contourArea(c) for c in contours]
-        total_area = sum(contour_areas)
-        largest_area = contour_areas[0] if contour_areas else 0
-        second_largest_area = contour_areas[1] if len(contour_areas) > 1 else 0
+        total_area = float(areas.sum())
+        largest_area = float(areas[top_idx[0]])
+        second_largest_area = float(areas[top_idx[1]]) if k > 1 else 0
 
         # 计算周长
-        largest_perimeter = cv2.arcLength(sorted_contours[0], True) if sorted_contours else 0
+        largest_perimeter = cv2.arcLength(contours[top_idx[0]], True)
 
         # 计算比例
         area_ratio = (largest_area / total_area * 100) if total_area > 0 else 0
@@ -375,7 +485,8 @@ class ContourAnalysisService:
             largest_perimeter=largest_perimeter,
             total_area=total_area,
             area_ratio=area_ratio,
-            contour_areas=contour_areas,
+            contour_areas=areas.tolist(),
+            contour_area_hist=np.histogram(areas, bins=16)[0].tolist(),
             algorithm_used=algorithm,
             processing_time=processing_time
         )
@@ -408,27 +519,89 @@ class ContourAnalysisService:
 
 # ===================== 多线程任务管理 =====================
 
-class AnalysisWorker(QThread):
-    """分析工作线程"""
+class AnalysisWorkerSignals(QObject):
+    """分析任务的信号载体（QRunnable不是QObject，信号单独承载）"""
     progress = pyqtSignal(int)
     finished = pyqtSignal(object)  # AnalysisResult
     error = pyqtSignal(str)
 
+
+class AnalysisWorker(QRunnable):
+    """分析工作任务
+
+    投递到全局QThreadPool执行，复用池内常驻线程，免去每次分析
+    新建QThread的启动开销；取消通过协作式Event检查，
+    替代不安全的terminate()
+    """
+
     def __init__(self, image: np.ndarray, config: AnalysisConfig, algorithm: str = None):
         super().__init__()
         self.image = image
         self.config = config
         self.algorithm = algorithm
         self.service = ContourAnalysisService(config)
+        self.signals = AnalysisWorkerSignals()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """请求取消：任务在下一个阶段边界自行退出"""
+        self._cancel_event.set()
 
     def run(self):
         try:
-            self.progress.emit(20)
+            if self._cancel_event.is_set():
+                return
+            self.signals.progress.emit(20)
             result = self.service.analyze_image(self.image, self.algorithm)
-            self.progress.emit(100)
-            self.finished.emit(result)
+            if self._cancel_event.is_set():
+                return
+            self.signals.progress.emit(100)
+            self.signals.finished.emit(result)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+
+class BatchAnalysisWorkerSignals(QObject):
+    """批量分析任务的信号载体"""
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(list)  # List[AnalysisResult]
+    error = pyqtSignal(str)
+
+
+class BatchAnalysisWorker(QRunnable):
+    """批量分析任务：一个常驻任务顺序处理整组图像
+
+    复用同一个ContourAnalysisService，算法实例缓存的结构元素和
+    掩码/梯度缓冲区在各帧之间保持热态，免去逐帧新建线程任务
+    与重新分配的开销；进度按已完成帧数上报
+    """
+
+    def __init__(self, images: List[np.ndarray], config: AnalysisConfig,
+                 algorithm: str = None):
+        super().__init__()
+        self.images = images
+        self.config = config
+        self.algorithm = algorithm
+        self.service = ContourAnalysisService(config)
+        self.signals = BatchAnalysisWorkerSignals()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """请求取消：当前帧结束后退出，不再处理后续图像"""
+        self._cancel_event.set()
+
+    def run(self):
+        try:
+            results = []
+            total = len(self.images)
+            for i, image in enumerate(self.images, start=1):
+                if self._cancel_event.is_set():
+                    return
+                results.append(self.service.analyze_image(image, self.algorithm))
+                self.signals.progress.emit(int(100 * i / total))
+            self.signals.finished.emit(results)
+        except Exception as e:
+            self.signals.error.emit(str(e))
 
 
 # ===================== 数据持久化 =====================
@@ -436,43 +609,106 @@ class AnalysisWorker(QThread):
 class DataManager:
     """数据管理器"""
 
+    # 历史记录保留条数；文件行数超过其2倍时触发压缩
+    _HISTORY_CAP = 100
+
     def __init__(self, data_dir: str = "analysis_data"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.config_file = self.data_dir / "config.json"
-        self.results_file = self.data_dir / "analysis_history.json"
+        self.results_file = self.data_dir / "analysis_history.jsonl"
+        self._line_count = None  # 惰性统计，避免每次保存重数文件
+        self._history = None  # 最近记录的内存deque，首次访问时从文件加载
+
+    @staticmethod
+    def _serializable(result: AnalysisResult) -> Dict:
+        """转为可落盘的字典，跳过标记为serialize=False的字段"""
+        return {f.name: getattr(result, f.name) for f in fields(result)
+                if f.metadata.get('serialize', True)}
+
+    @staticmethod
+    def _dumps_line(obj: Dict) -> str:
+        """序列化单条记录（无缩进，一行一条）"""
+        if _orjson is not None:
+            return _orjson.dumps(obj).decode('utf-8')
+        return json.dumps(obj, ensure_ascii=False)
+
+    @staticmethod
+    def _loads(text) -> Dict:
+        """反序列化单条记录"""
+        if _orjson is not None:
+            return _orjson.loads(text)
+        return json.loads(text)
 
     def save_config(self, config: AnalysisConfig):
         """保存配置"""
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(asdict(config), f, indent=2, ensure_ascii=False)
+        if _orjson is not None:
+            self.config_file.write_bytes(
+                _orjson.dumps(asdict(config), option=_orjson.OPT_INDENT_2))
+        else:
+            with open(self.config_file, 'w', encoding='utf-8') as f:
+                json.dump(asdict(config), f, indent=2, ensure_ascii=False)
 
     def load_config(self) -> AnalysisConfig:
         """加载配置"""
         if self.config_file.exists():
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return AnalysisConfig(**data)
+            data = self._loads(self.config_file.read_bytes())
+            return AnalysisConfig(**data)
         return AnalysisConfig()
 
     def save_result(self, result: AnalysisResult):
-        """保存分析结果"""
-        results = self.load_results()
-        results.append(asdict(result))
+        """保存分析结果
 
-        # 只保留最近100条记录
-        if len(results) > 100:
-            results = results[-100:]
+        JSONL追加写：每次保存只写一行并同步追加到内存deque，
+        与历史长度无关；截断不再触碰磁盘，推迟到显式compact()
+        （原先整文件读-改-写为O(N)，且中途崩溃会损坏整个历史）
+        """
+        record = self._serializable(result)
+        self._ensure_history().append(record)
 
-        with open(self.results_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        with open(self.results_file, 'a', encoding='utf-8') as f:
+            f.write(self._dumps_line(record) + '\n')
+
+        if self._line_count is None:
+            self._line_count = self._count_lines()
+        else:
+            self._line_count += 1
 
     def load_results(self) -> List[Dict]:
-        """加载历史结果"""
-        if self.results_file.exists():
-            with open(self.results_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return []
+        """加载历史结果（最近_HISTORY_CAP条）"""
+        return list(self._ensure_history())
+
+    def _ensure_history(self) -> deque:
+        """惰性加载内存历史deque（固定容量，自动淘汰最旧记录）"""
+        if self._history is None:
+            self._history = deque(maxlen=self._HISTORY_CAP)
+            if self.results_file.exists():
+                with open(self.results_file, 'r', encoding='utf-8') as f:
+                    self._history.extend(
+                        self._loads(line) for line in f if line.strip())
+        return self._history
+
+    def _count_lines(self) -> int:
+        """统计历史文件现有行数"""
+        if not self.results_file.exists():
+            return 0
+        with open(self.results_file, 'r', encoding='utf-8') as f:
+            return sum(1 for line in f if line.strip())
+
+    def compact(self):
+        """压缩历史文件：从内存deque一次性重写最近_HISTORY_CAP条
+
+        只在文件实际超出上限时重写；适合在应用退出时调用
+        """
+        if self._line_count is None:
+            self._line_count = self._count_lines()
+        if self._line_count <= self._HISTORY_CAP:
+            return
+
+        tail = self._ensure_history()
+        with open(self.results_file, 'w', encoding='utf-8') as f:
+            f.writelines(self._dumps_line(r) + '\n' for r in tail)
+        self._line_count = len(tail)
 
 
 # ===================== 性能监控 =====================
@@ -485,14 +721,14 @@ class PerformanceMonitor:
 
     def start_timer(self, operation: str):
         """开始计时"""
-        self.metrics[operation] = {'start': datetime.now()}
+        self.metrics[operation] = {'start_ns': time.perf_counter_ns()}
 
     def end_timer(self, operation: str):
         """结束计时"""
         if operation in self.metrics:
             self.metrics[operation]['duration'] = (
-                    datetime.now() - self.metrics[operation]['start']
-            ).total_seconds()
+                time.perf_counter_ns() - self.metrics[operation]['start_ns']
+            ) * 1e-9
 
     def get_metrics(self) -> Dict:
         """获取性能指标"""
@@ -552,16 +788,16 @@ class OptimizedStoneAnalysisApp(QMainWindow):
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
 
-        # 创建工作线程
+        # 创建工作任务并投递到全局线程池
         algorithm = self.get_selected_algorithm()
         self.analysis_worker = AnalysisWorker(self.current_image, self.config, algorithm)
-        self.analysis_worker.progress.connect(self.progress_bar.setValue)
-        self.analysis_worker.finished.connect(self.on_analysis_finished)
-        self.analysis_worker.error.connect(self.on_analysis_error)
+        self.analysis_worker.signals.progress.connect(self.progress_bar.setValue)
+        self.analysis_worker.signals.finished.connect(self.on_analysis_finished)
+        self.analysis_worker.signals.error.connect(self.on_analysis_error)
 
         # 开始分析
         self.performance_monitor.start_timer('full_analysis')
-        self.analysis_worker.start()
+        QThreadPool.globalInstance().start(self.analysis_worker)
 
     def on_analysis_finished(self, result: AnalysisResult):
         """分析完成处理"""
@@ -596,13 +832,13 @@ class OptimizedStoneAnalysisApp(QMainWindow):
 
     def closeEvent(self, event):
         """关闭事件处理"""
-        # 保存配置
+        # 保存配置并压缩分析历史
         self.data_manager.save_config(self.config)
+        self.data_manager.compact()
 
-        # 停止工作线程
-        if self.analysis_worker and self.analysis_worker.isRunning():
-            self.analysis_worker.terminate()
-            self.analysis_worker.wait()
+        # 协作式取消未完成的分析任务
+        if self.analysis_worker is not None:
+            self.analysis_worker.cancel()
 
         event.accept()
 
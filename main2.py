@@ -1,4 +1,5 @@
 import cv2
+import numpy as np
 # СЧИТЫВАНИЕ ИЗОБРАЖЕНИЯ:
 img = cv2.imread('rock4.png')
 cv2.imshow('Picture 1', img)
@@ -50,11 +51,9 @@ edges = cv2.Canny(gray, 50,200)
 contours, hierarchy= cv2.findContours(edges.copy(), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
 cv2.destroyAllWindows()
 def get_contour_areas(contours):
-    all_areas = []
-    for cnt in contours:
-        area = cv2.contourArea(cnt)
-        all_areas.append(area)
-    return all_areas
+    # ПЛОЩАДИ СРАЗУ В МАССИВ NUMPY, БЕЗ ПОЭЛЕМЕНТНОГО APPEND:
+    return np.fromiter((cv2.contourArea(cnt) for cnt in contours),
+                       np.float64, count=len(contours))
 
 
 
@@ -13,7 +13,7 @@
 import cv2
 import numpy as np
 from PyQt5.QtGui import QImage, QPixmap
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QTimer, QEvent
 
 
 def create_demo_image():
@@ -25,10 +25,10 @@ def create_demo_image():
     """
     # 创建基础背景图像
     img = np.ones((400, 600, 3), dtype=np.uint8) * 200
-    
-    # 设置随机种子以确保可重现的结果
-    np.random.seed(42)
-    
+
+    # 固定种子的Generator确保可重现的结果
+    rng = np.random.default_rng(42)
+
     # 定义碎石颜色调色板
     colors = [
         (120, 120, 120),  # 灰色
@@ -37,67 +37,85 @@ def create_demo_image():
         (150, 130, 100),  # 褐色
         (200, 200, 200),  # 白色
     ]
-    
-    # 生成150个随机椭圆形碎石
-    for _ in range(150):
-        # 随机位置
-        x = np.random.randint(20, 580)
-        y = np.random.randint(20, 380)
-        
-        # 随机大小
-        size = np.random.randint(8, 25)
-        
-        # 随机颜色
-        color = colors[np.random.randint(0, len(colors))]
-        
+
+    # 150个椭圆的参数一次性批量抽取，循环内只剩绘制调用
+    count = 150
+    xs = rng.integers(20, 580, count)
+    ys = rng.integers(20, 380, count)
+    sizes = rng.integers(8, 25, count)
+    color_idx = rng.integers(0, len(colors), count)
+    angles = rng.integers(0, 180, (count, 2))
+
+    for i in range(count):
+        center = (int(xs[i]), int(ys[i]))
+        axes = (int(sizes[i]), int(sizes[i] * 0.8))
+
         # 绘制填充椭圆（碎石主体）
-        cv2.ellipse(img, (x, y), (size, int(size * 0.8)),
-                    np.random.randint(0, 180), 0, 360, color, -1)
-        
+        cv2.ellipse(img, center, axes,
+                    int(angles[i, 0]), 0, 360, colors[color_idx[i]], -1)
+
         # 绘制椭圆边框（增加真实感）
-        cv2.ellipse(img, (x, y), (size, int(size * 0.8)),
-                    np.random.randint(0, 180), 0, 360, (80, 80, 80), 1)
-    
-    # 添加噪声以增加真实感
-    noise = np.random.normal(0, 10, img.shape).astype(np.int16)
-    img = np.clip(img.astype(np.int16) + noise, 0, 255).astype(np.uint8)
-    
-    return img
+        cv2.ellipse(img, center, axes,
+                    int(angles[i, 1]), 0, 360, (80, 80, 80), 1)
+
+    # 添加噪声以增加真实感：单个float32工作副本上原地加噪、原地裁剪，
+    # 避免原先int16升格产生的多张全图临时数组
+    noise = rng.standard_normal(img.shape, dtype=np.float32)
+    noise *= 10.0
+    img_f = img.astype(np.float32)
+    np.add(img_f, noise, out=img_f)
+    np.clip(img_f, 0, 255, out=img_f)
+
+    return img_f.astype(np.uint8)
+
+
+# Qt 5.14+原生支持BGR888，可直接包装OpenCV的BGR缓冲区，省去整幅cvtColor
+_HAS_BGR888 = hasattr(QImage, 'Format_BGR888')
 
 
 def convert_cv_to_qimage(cv_img):
     """
     将OpenCV图像转换为QImage格式
-    
+
     Args:
         cv_img (numpy.ndarray): OpenCV图像 (BGR格式)
-        
+
     Returns:
         QImage: 转换后的QImage对象
     """
     if cv_img is None:
         return None
-        
-    # 转换BGR到RGB
-    rgb_image = cv2.cvtColor(cv_img, cv2.COLOR_BGR2RGB)
-    height, width, channel = rgb_image.shape
+
+    height, width, channel = cv_img.shape
     bytes_per_line = 3 * width
-    
-    # 创建QImage
-    q_image = QImage(rgb_image.data, width, height, bytes_per_line, QImage.Format_RGB888)
-    
+
+    if _HAS_BGR888:
+        # 零拷贝包装BGR缓冲区，无需BGR→RGB转换
+        buffer = np.ascontiguousarray(cv_img)
+        q_image = QImage(buffer.data, width, height, bytes_per_line, QImage.Format_BGR888)
+    else:
+        # 旧版Qt回退：单次cvtColor转换后零拷贝包装
+        buffer = np.ascontiguousarray(cv2.cvtColor(cv_img, cv2.COLOR_BGR2RGB))
+        q_image = QImage(buffer.data, width, height, bytes_per_line, QImage.Format_RGB888)
+
+    # 保持对缓冲区的引用，防止NumPy数组被GC回收导致悬空指针
+    q_image.ndarray = buffer
+
     return q_image
 
 
-def scale_pixmap_to_label(pixmap, label, scale_factor=0.85):
+def scale_pixmap_to_label(pixmap, label, scale_factor=0.85,
+                          transform=Qt.SmoothTransformation):
     """
     将QPixmap缩放以适应标签大小
-    
+
     Args:
         pixmap (QPixmap): 要缩放的像素图
         label (QLabel): 目标标签
         scale_factor (float): 缩放因子 (默认0.85)
-        
+        transform (Qt.TransformationMode): 缩放插值模式，拖拽中可用
+            Qt.FastTransformation换取数倍的重采样速度
+
     Returns:
         QPixmap: 缩放后的像素图
     """
@@ -106,31 +124,77 @@ def scale_pixmap_to_label(pixmap, label, scale_factor=0.85):
         int(label_size.width() * scale_factor),
         int(label_size.height() * scale_factor),
         Qt.KeepAspectRatio,
-        Qt.SmoothTransformation
+        transform
     )
     return scaled_pixmap
 
 
+class _LabelResizeRescaler(QObject):
+    """
+    标签尺寸变化时重建缩放像素图的事件过滤器
+
+    拖拽过程中立即用FastTransformation（近邻插值，比双线性快数倍）
+    重采样保持画面跟手，停止调整150ms后由防抖定时器再做一次
+    SmoothTransformation的高质量重绘
+    """
+
+    def __init__(self, label):
+        super().__init__(label)
+        self._label = label
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(150)
+        self._timer.timeout.connect(self._rebuild)
+        label.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Resize:
+            source = getattr(self._label, '_source_pixmap', None)
+            if source is not None:
+                self._label.setPixmap(scale_pixmap_to_label(
+                    source, self._label, transform=Qt.FastTransformation))
+                self._timer.start()
+        return False
+
+    def _rebuild(self):
+        source = getattr(self._label, '_source_pixmap', None)
+        if source is not None:
+            self._label.setPixmap(scale_pixmap_to_label(source, self._label))
+
+
 def display_image_in_label(cv_img, label):
     """
     在QLabel中显示OpenCV图像
-    
+
     Args:
         cv_img (numpy.ndarray): OpenCV图像 (BGR格式)
         label (QLabel): 目标标签控件
     """
     if cv_img is None:
         return
-        
+
+    # 图像明显大于标签时先用OpenCV的INTER_AREA降采样，
+    # Qt侧的色彩转换与缩放只处理标签大小的小图
+    label_w = max(label.width(), 1)
+    label_h = max(label.height(), 1)
+    img_h, img_w = cv_img.shape[:2]
+    if img_w > label_w or img_h > label_h:
+        scale = min(label_w / img_w, label_h / img_h)
+        new_size = (max(int(img_w * scale), 1), max(int(img_h * scale), 1))
+        cv_img = cv2.resize(cv_img, new_size, interpolation=cv2.INTER_AREA)
+
     # 转换为QImage
     q_image = convert_cv_to_qimage(cv_img)
     if q_image is None:
         return
-        
-    # 转换为QPixmap并缩放
+
+    # 转换为QPixmap，缩放一次后缓存；后续仅在标签几何变化时重建
     pixmap = QPixmap.fromImage(q_image)
+    label._source_pixmap = pixmap
+    if getattr(label, '_resize_rescaler', None) is None:
+        label._resize_rescaler = _LabelResizeRescaler(label)
     scaled_pixmap = scale_pixmap_to_label(pixmap, label)
-    
+
     # 设置到标签
     label.setPixmap(scaled_pixmap)
 
@@ -146,19 +210,20 @@ def validate_image_file(file_path):
         tuple: (is_valid, error_message)
     """
     try:
-        # 尝试读取文件
+        # 验证只需确认可解码和最小尺寸，按1/4比例解码即可——
+        # JPEG解码器在降比例下可跳过高频系数，大图上快数倍
         img_np = np.fromfile(file_path, dtype=np.uint8)
-        img = cv2.imdecode(img_np, cv2.IMREAD_COLOR)
-        
+        img = cv2.imdecode(img_np, cv2.IMREAD_REDUCED_COLOR_4)
+
         if img is None:
             return False, "无法解码图像文件"
-            
-        # 检查图像尺寸
-        if img.shape[0] < 50 or img.shape[1] < 50:
+
+        # 检查图像尺寸（解码结果为原图的1/4，按比例换算回去）
+        if img.shape[0] * 4 < 50 or img.shape[1] * 4 < 50:
             return False, "图像尺寸过小"
-            
+
         return True, ""
-        
+
     except Exception as e:
         return False, f"文件读取错误: {str(e)}"
 